@@ -7,7 +7,6 @@ from typing import Optional, Dict, Any, List
 
 from base import BaseClient
 from config import ElevenLabsConfig
-from logger import APICallLogger
 
 
 class AgentService(BaseClient):
@@ -95,7 +94,7 @@ class AgentService(BaseClient):
             ...     tool_ids=["tool_abc123", "tool_xyz789"]
             ... )
         """
-        with APICallLogger(self.logger, "Create Agent"):
+        with self._apilog("Create Agent"):
             # If full config provided, use it directly
             if conversation_config is not None:
                 payload = {"conversation_config": conversation_config}
@@ -183,7 +182,7 @@ class AgentService(BaseClient):
             >>> agent = service.get_agent("J3Pbu5gP6NNKBscdCdwB")
             >>> print(agent["name"])
         """
-        with APICallLogger(self.logger, "Get Agent", agent_id=agent_id):
+        with self._apilog("Get Agent", agent_id=agent_id):
             response = self._make_request(
                 method="GET",
                 endpoint=f"{self.AGENTS_ENDPOINT}/{agent_id}"
@@ -214,7 +213,7 @@ class AgentService(BaseClient):
             >>> for agent in result.get("agents", []):
             ...     print(agent["agent_id"], agent.get("name"))
         """
-        with APICallLogger(self.logger, "List Agents"):
+        with self._apilog("List Agents"):
             params = {"page_size": page_size}
             if cursor:
                 params["cursor"] = cursor
@@ -254,7 +253,7 @@ class AgentService(BaseClient):
             ...     conversation_config={"agent": {"first_message": "New greeting!"}}
             ... )
         """
-        with APICallLogger(self.logger, "Update Agent", agent_id=agent_id):
+        with self._apilog("Update Agent", agent_id=agent_id):
             payload = {}
             
             if conversation_config:
@@ -289,7 +288,7 @@ class AgentService(BaseClient):
         Example:
             >>> service.delete_agent("J3Pbu5gP6NNKBscdCdwB")
         """
-        with APICallLogger(self.logger, "Delete Agent", agent_id=agent_id):
+        with self._apilog("Delete Agent", agent_id=agent_id):
             response = self._make_request(
                 method="DELETE",
                 endpoint=f"{self.AGENTS_ENDPOINT}/{agent_id}"
@@ -11,6 +11,14 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+try:
+    # Rust JSON encoder for every response; ~5-10x faster than the
+    # stdlib encoder JSONResponse uses
+    import orjson  # noqa: F401 - ORJSONResponse needs it at runtime
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+except ImportError:
+    _DefaultResponse = JSONResponse
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -24,6 +32,7 @@ from api.routers.ecommerce import router as ecommerce_router
 from api.routers.tools import router as tools_router
 from api.routers.webhooks import router as webhooks_router
 from api.dependencies import ClientManager, get_config
+from base import close_shared_session
 from api.schemas import HealthResponse, ErrorResponse
 from logger import setup_logger
 from exceptions import ElevenLabsError, AuthenticationError
@@ -55,6 +64,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down ElevenLabs API server...")
     ClientManager.close()
+    close_shared_session()
     logger.info("Cleanup complete")
 
 
@@ -88,7 +98,8 @@ Respects ElevenLabs API rate limits. 429 errors include retry-after information.
     lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    default_response_class=_DefaultResponse
 )
 
 
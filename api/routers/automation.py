@@ -12,6 +12,13 @@ from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field
 
 from client import get_elevenlabs_client
+from api.schemas import (
+    CreateAgentRequest,
+    CreateEmailTemplateRequest,
+    SubmitBatchJobRequest
+)
+from email_templates import get_email_template_service, set_webhook_base_url
+from exceptions import ElevenLabsError
 
 logger = logging.getLogger("elevenlabs.automation")
 
@@ -800,3 +807,146 @@ async def _extract_appointment_rules(conversation_id: str, transcript_text: str,
         "transcript_turns": len(transcript),
         "method": "rules"
     }
+
+
+# =============================================================================
+# Appointment Bootstrap (compound endpoint)
+# =============================================================================
+
+class BootstrapBatchRequest(SubmitBatchJobRequest):
+    """Batch payload for the bootstrap flow; agent_id is filled in server-side."""
+    agent_id: Optional[str] = Field(
+        None,
+        description="Ignored; set from the agent created in the same request"
+    )
+
+
+class AppointmentBootstrapRequest(BaseModel):
+    """Create a template, an agent wired to its tool, and a batch job in one call."""
+    template: CreateEmailTemplateRequest
+    agent: CreateAgentRequest
+    batch: BootstrapBatchRequest
+
+
+@router.post(
+    "/appointment-bootstrap",
+    response_model=AutomationResponse,
+    status_code=201,
+    summary="Bootstrap Template + Agent + Batch Call",
+    description="Atomically create an email template, an agent using its webhook tool, and submit the batch calling job"
+)
+async def appointment_bootstrap(request: AppointmentBootstrapRequest):
+    """
+    Run the template -> agent -> batch-call chain server-side.
+
+    Scripts previously drove these three stages with separate round-trips,
+    shuttling tool_id and agent_id back and forth. Here the IDs are wired
+    across stages in-process, so the client pays a single RTT and never
+    observes a half-built flow (template without agent, agent without job).
+    """
+    try:
+        # 1. Email template (+ auto-created webhook tool)
+        if request.template.webhook_base_url:
+            set_webhook_base_url(request.template.webhook_base_url)
+        service = get_email_template_service(request.template.webhook_base_url)
+
+        params = None
+        if request.template.parameters:
+            params = [p.model_dump() for p in request.template.parameters]
+
+        template = service.create_template(
+            name=request.template.name,
+            description=request.template.description,
+            subject_template=request.template.subject_template,
+            body_template=request.template.body_template,
+            parameters=params,
+            auto_create_tool=True,
+            sender_email=request.template.sender_email
+        )
+        if not template.tool_id:
+            raise HTTPException(
+                status_code=500,
+                detail="Template created but no webhook tool was attached"
+            )
+
+        # 2. Agent wired to the template's tool
+        client = get_elevenlabs_client()
+        tool_ids = list(request.agent.tool_ids or [])
+        if template.tool_id not in tool_ids:
+            tool_ids.append(template.tool_id)
+
+        agent_result = client.agents.create_agent(
+            name=request.agent.name,
+            voice_id=request.agent.voice_id,
+            first_message=request.agent.first_message,
+            system_prompt=request.agent.system_prompt,
+            language=request.agent.language,
+            tool_ids=tool_ids,
+            knowledge_base_ids=request.agent.knowledge_base_ids,
+            model=request.agent.model
+        )
+        agent_id = agent_result["agent_id"]
+
+        # 3. Batch job for the freshly created agent
+        recipients = []
+        for r in request.batch.recipients:
+            recipient_data = {"phone_number": r.phone_number}
+            if r.name:
+                recipient_data["name"] = r.name
+            if r.dynamic_variables:
+                recipient_data["conversation_initiation_client_data"] = {
+                    "dynamic_variables": r.dynamic_variables
+                }
+            recipients.append(recipient_data)
+
+        job = client.batch_calling.submit_job(
+            call_name=request.batch.call_name,
+            agent_id=agent_id,
+            recipients=recipients,
+            phone_number_id=request.batch.phone_number_id,
+            scheduled_time_unix=request.batch.scheduled_time_unix,
+            timezone=request.batch.timezone,
+            retry_count=request.batch.retry_count
+        )
+        job_id = job.get("id")
+
+        # Same webhook context the standalone batch endpoint stores
+        if (request.batch.ecommerce_credentials or request.batch.sender_email
+                or any(r.email for r in request.batch.recipients)):
+            from ecommerce import get_batch_job_context
+            ecom_creds = None
+            if request.batch.ecommerce_credentials:
+                ecom_creds = request.batch.ecommerce_credentials.model_dump()
+            get_batch_job_context().store_job(
+                job_id=job_id,
+                agent_id=agent_id,
+                ecommerce_credentials=ecom_creds,
+                sender_email=request.batch.sender_email,
+                recipients=[
+                    {
+                        "phone_number": r.phone_number,
+                        "name": r.name,
+                        "email": r.email,
+                        "dynamic_variables": r.dynamic_variables
+                    }
+                    for r in request.batch.recipients
+                ]
+            )
+
+        return AutomationResponse(
+            success=True,
+            message="Template, agent and batch job created",
+            data={
+                "template_id": template.template_id,
+                "tool_id": template.tool_id,
+                "agent_id": agent_id,
+                "batch_job": job
+            }
+        )
+
+    except HTTPException:
+        raise
+    except ElevenLabsError as e:
+        raise HTTPException(status_code=e.status_code or 500, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -3,21 +3,160 @@ Base HTTP client for ElevenLabs API.
 Provides common HTTP functionality for all service classes.
 """
 
+import time
+import threading
 from typing import Optional, Dict, Any
 import requests
+import urllib3
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson  # optional C JSON codec for the low-overhead POST path
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+try:
+    import httpx  # optional; enables the async request path
+except ImportError:
+    httpx = None
+
 from config import ElevenLabsConfig
-from logger import setup_logger
+from logger import setup_logger, APICallLogger
 from exceptions import (
     ElevenLabsError,
     ConnectionError,
     TimeoutError,
-    raise_for_status
+    RateLimitError,
+    NotFoundError,
+    raise_for_status,
+    retry_with_backoff
 )
 
 
+class RateLimiter:
+    """
+    Thread-safe token bucket that pre-gates API requests.
+
+    Converts would-be 429 round-trips into local sleeps: a request only
+    goes on the wire once a token is available, and a server-side 429
+    halves the refill rate so the client backs off without hammering.
+    """
+
+    def __init__(self, capacity: int, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, weight: float = 1.0) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._last) * self.refill_rate
+                )
+                self._last = now
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return
+                wait = (weight - self._tokens) / self.refill_rate
+            time.sleep(wait)
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """Back off after a server-side 429."""
+        with self._lock:
+            if retry_after:
+                # Server told us its budget; match it
+                self.refill_rate = max(1.0 / float(retry_after), 0.1)
+            else:
+                self.refill_rate = max(self.refill_rate / 2, 0.1)
+            self._tokens = 0.0
+            self._last = time.monotonic()
+
+
+# One session shared by every service client, so KB/phone/tools traffic
+# multiplexes over a single connection pool instead of re-handshaking
+# TCP+TLS per service instance
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def close_shared_session() -> None:
+    """Close the HTTP session shared by all service clients."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is not None:
+            _shared_session.close()
+            _shared_session = None
+
+
+# Async counterpart to the shared sync session, for callers fanning out
+# many independent requests under asyncio.gather
+_shared_async_client = None
+
+
+def _get_async_client():
+    """Shared httpx.AsyncClient, created on first use."""
+    global _shared_async_client
+    if _shared_async_client is None:
+        with _shared_session_lock:
+            if _shared_async_client is None:
+                if httpx is None:
+                    raise ElevenLabsError(
+                        "httpx is required for async requests"
+                    )
+                limits = httpx.Limits(
+                    max_connections=64, max_keepalive_connections=16
+                )
+                try:
+                    # Multiplexes concurrent requests over one connection
+                    _shared_async_client = httpx.AsyncClient(
+                        http2=True, limits=limits
+                    )
+                except ImportError:
+                    # h2 extra not installed; HTTP/1.1 keep-alive still pools
+                    _shared_async_client = httpx.AsyncClient(limits=limits)
+    return _shared_async_client
+
+
+async def aclose_shared_client() -> None:
+    """Close the async client shared by all service clients."""
+    global _shared_async_client
+    if _shared_async_client is not None:
+        await _shared_async_client.aclose()
+        _shared_async_client = None
+
+
+# Bare urllib3 pool for the hottest POST loops: skips requests' prepared
+# request, cookie jar and redirect machinery while staying pooled
+_shared_pool: Optional[urllib3.PoolManager] = None
+
+
+def _get_pool() -> urllib3.PoolManager:
+    """Shared urllib3.PoolManager, created on first use."""
+    global _shared_pool
+    if _shared_pool is None:
+        with _shared_session_lock:
+            if _shared_pool is None:
+                _shared_pool = urllib3.PoolManager(
+                    num_pools=4,
+                    maxsize=16,
+                    retries=Retry(3, backoff_factor=0.3)
+                )
+    return _shared_pool
+
+
 class BaseClient:
     """
     Base HTTP client with common functionality.
@@ -29,45 +168,89 @@ class BaseClient:
     
     All service classes inherit from this base.
     """
-    
+
+    # How long a 404 for a GET endpoint is remembered before re-checking
+    NOT_FOUND_TTL = 60  # seconds
+    _NOT_FOUND_CACHE_MAX = 256
+
     def __init__(
         self,
         config: ElevenLabsConfig,
-        logger_name: str = "elevenlabs.base"
+        logger_name: str = "elevenlabs.base",
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize base client.
-        
+
         Args:
             config: ElevenLabsConfig instance
             logger_name: Name for the logger
+            session: Optional session override; defaults to the pool
+                shared by all services
         """
         self.config = config
         self.logger = setup_logger(name=logger_name, level=config.log_level)
-        self.session = self._create_session()
+        # Re-armed per call via __call__; avoids allocating a fresh
+        # context-manager object for every request. One per thread so
+        # methods fanned out via an executor don't clobber each other
+        self._apilog_local = threading.local()
+        self.session = session if session is not None else self._shared_or_create()
+        self._rate_limiter = RateLimiter(
+            capacity=config.rate_limit_capacity,
+            refill_rate=config.rate_limit_refill
+        )
+        # Endpoints that recently returned 404, mapped to when they did;
+        # repeat GETs short-circuit locally instead of re-asking the API
+        self._not_found_cache: Dict[str, float] = {}
+        # Snapshot of the auth headers for the _fast_post path
+        self._fast_headers = config.headers
     
+    @property
+    def _apilog(self) -> APICallLogger:
+        """This thread's reusable call logger."""
+        log = getattr(self._apilog_local, "log", None)
+        if log is None:
+            log = APICallLogger(self.logger, "")
+            self._apilog_local.log = log
+        return log
+
+    def _shared_or_create(self) -> requests.Session:
+        """Get the shared session, creating it on first use."""
+        global _shared_session
+        if _shared_session is None:
+            with _shared_session_lock:
+                if _shared_session is None:
+                    _shared_session = self._create_session()
+        return _shared_session
+
     def _create_session(self) -> requests.Session:
         """
         Create a requests session with retry logic.
-        
+
         Returns:
             Configured requests session
         """
         session = requests.Session()
-        
+
         retry_strategy = Retry(
             total=self.config.max_retries,
             backoff_factor=self.config.retry_delay,
             status_forcelist=[500, 502, 503, 504],
             allowed_methods=["GET", "POST", "PUT", "DELETE", "PATCH"]
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+
+        # Pool sized for several services sharing this one session
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=retry_strategy
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
-        
+
         return session
     
+    @retry_with_backoff()
     def _make_request(
         self,
         method: str,
@@ -101,21 +284,39 @@ class BaseClient:
             request_headers.update(headers)
         
         self.logger.debug(f"Making {method} request to {url}")
-        
+
+        if method == "GET":
+            cached_at = self._not_found_cache.get(endpoint)
+            if cached_at is not None:
+                if time.monotonic() - cached_at < self.NOT_FOUND_TTL:
+                    raise NotFoundError(
+                        message="Resource not found",
+                        status_code=404
+                    )
+                del self._not_found_cache[endpoint]
+        else:
+            # Writes may bring the resource into existence; drop stale 404s
+            self._not_found_cache.pop(endpoint, None)
+
+        # Pre-gate locally so we don't burn a round-trip on a 429
+        self._rate_limiter.acquire()
+
         try:
+            # Serialize with the C codec when available; the default
+            # headers already declare application/json
             response = self.session.request(
                 method=method,
                 url=url,
-                json=data,
+                data=_dumps(data) if data is not None else None,
                 params=params,
                 headers=request_headers,
                 timeout=self.config.timeout
             )
-            
+
             self.logger.debug(f"Response status: {response.status_code}")
-            
+
             try:
-                response_data = response.json() if response.content else {}
+                response_data = _loads(response.content) if response.content else {}
             except ValueError:
                 response_data = {"raw_content": response.text}
             
@@ -123,7 +324,19 @@ class BaseClient:
                 raise_for_status(response.status_code, response_data)
             
             return response_data
-            
+
+        except NotFoundError:
+            if method == "GET":
+                if len(self._not_found_cache) >= self._NOT_FOUND_CACHE_MAX:
+                    self._not_found_cache.clear()
+                self._not_found_cache[endpoint] = time.monotonic()
+            raise
+
+        except RateLimitError as e:
+            # Server-side 429 anyway: recalibrate the local bucket down
+            self._rate_limiter.throttle(e.retry_after)
+            raise
+
         except requests.exceptions.ConnectionError as e:
             self.logger.error(f"Connection error: {str(e)}")
             raise ConnectionError(f"Failed to connect to API: {str(e)}")
@@ -136,7 +349,137 @@ class BaseClient:
             self.logger.error(f"Request error: {str(e)}")
             raise ElevenLabsError(f"Request failed: {str(e)}")
     
+    @retry_with_backoff()
+    def _fast_post(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Low-overhead POST for per-recipient hot loops.
+
+        Goes straight through the shared urllib3 pool with a
+        pre-serialized body, avoiding the prepared-request, cookie and
+        redirect handling a Session.request carries. Rate limiting,
+        429 retries and error mapping match _make_request; the 404
+        cache does not apply to POSTs.
+
+        Args:
+            endpoint: API endpoint path
+            payload: Request body data
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            ElevenLabsError: On API errors
+        """
+        self._rate_limiter.acquire()
+
+        # Map urllib3's exceptions onto the library's, mirroring what
+        # _make_request does for the requests ones
+        try:
+            response = _get_pool().request(
+                "POST",
+                self.config.base_url + endpoint,
+                body=_dumps(payload),
+                headers=self._fast_headers,
+                timeout=self.config.timeout
+            )
+        except urllib3.exceptions.TimeoutError as e:
+            self.logger.error(f"Request timeout: {str(e)}")
+            raise TimeoutError(f"Request timed out: {str(e)}")
+        except (urllib3.exceptions.MaxRetryError,
+                urllib3.exceptions.NewConnectionError,
+                urllib3.exceptions.ProtocolError) as e:
+            self.logger.error(f"Connection error: {str(e)}")
+            raise ConnectionError(f"Failed to connect to API: {str(e)}")
+        except urllib3.exceptions.HTTPError as e:
+            self.logger.error(f"Request error: {str(e)}")
+            raise ElevenLabsError(f"Request failed: {str(e)}")
+
+        try:
+            data = _loads(response.data) if response.data else {}
+        except ValueError:
+            data = {"raw_content": response.data.decode(errors="replace")}
+
+        if response.status >= 400:
+            try:
+                raise_for_status(response.status, data)
+            except RateLimitError as e:
+                self._rate_limiter.throttle(e.retry_after)
+                raise
+
+        return data
+
+    async def _make_request_async(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of _make_request.
+
+        Lets callers fan out independent requests with asyncio.gather
+        instead of paying one round-trip per call. Goes through the
+        shared httpx.AsyncClient; the sync path's retry and throttle
+        state is not consulted here.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, PATCH)
+            endpoint: API endpoint path
+            data: Request body data
+            params: Query parameters
+            headers: Additional headers
+
+        Returns:
+            API response as dictionary
+
+        Raises:
+            ElevenLabsError: On API errors
+            ConnectionError: On connection failures
+            TimeoutError: On request timeout
+        """
+        url = f"{self.config.base_url}{endpoint}"
+
+        request_headers = self.config.headers.copy()
+        if headers:
+            request_headers.update(headers)
+
+        client = _get_async_client()
+
+        try:
+            response = await client.request(
+                method,
+                url,
+                json=data,
+                params=params,
+                headers=request_headers,
+                timeout=self.config.timeout
+            )
+        except httpx.TimeoutException as e:
+            self.logger.error(f"Request timeout: {str(e)}")
+            raise TimeoutError(f"Request timed out: {str(e)}")
+        except httpx.HTTPError as e:
+            self.logger.error(f"Connection error: {str(e)}")
+            raise ConnectionError(f"Failed to connect to API: {str(e)}")
+
+        try:
+            response_data = response.json() if response.content else {}
+        except ValueError:
+            response_data = {"raw_content": response.text}
+
+        if response.status_code >= 400:
+            raise_for_status(response.status_code, response_data)
+
+        return response_data
+
     def close(self):
-        """Close the HTTP session."""
+        """Close the HTTP session if this instance owns it."""
+        if self.session is _shared_session:
+            # Other live clients ride the same pool; tearing it down here
+            # would close connections out from under their in-flight
+            # requests. Shared teardown happens only via
+            # close_shared_session() at application shutdown
+            return
         self.session.close()
         self.logger.info("Session closed")
@@ -7,7 +7,6 @@ from typing import Optional, Dict, Any, List
 
 from base import BaseClient
 from config import ElevenLabsConfig
-from logger import APICallLogger
 
 
 class BatchCallingService(BaseClient):
@@ -114,8 +113,8 @@ class BatchCallingService(BaseClient):
             ... )
             >>> print(f"Job submitted: {job['id']}, Status: {job['status']}")
         """
-        with APICallLogger(self.logger, "Submit Batch Calling Job",
-                          call_name=call_name, recipient_count=len(recipients)):
+        with self._apilog("Submit Batch Calling Job",
+                           call_name=call_name, recipient_count=len(recipients)):
             payload = {
                 "call_name": call_name,
                 "agent_id": agent_id,
@@ -174,7 +173,7 @@ class BatchCallingService(BaseClient):
             >>> print(f"Status: {job['status']}")
             >>> print(f"Progress: {job['total_calls_finished']}/{job['total_calls_scheduled']}")
         """
-        with APICallLogger(self.logger, "Get Batch Job", job_id=job_id):
+        with self._apilog("Get Batch Job", job_id=job_id):
             response = self._make_request(
                 method="GET",
                 endpoint=f"{self.BATCH_CALLING_ENDPOINT}/{job_id}"
@@ -209,7 +208,7 @@ class BatchCallingService(BaseClient):
             >>> for job in jobs.get("jobs", []):
             ...     print(f"{job['name']}: {job['status']}")
         """
-        with APICallLogger(self.logger, "List Batch Jobs"):
+        with self._apilog("List Batch Jobs"):
             params = {"page_size": page_size}
             
             if status:
@@ -242,7 +241,7 @@ class BatchCallingService(BaseClient):
         Example:
             >>> service.cancel_job("batch_abc123")
         """
-        with APICallLogger(self.logger, "Cancel Batch Job", job_id=job_id):
+        with self._apilog("Cancel Batch Job", job_id=job_id):
             response = self._make_request(
                 method="POST",
                 endpoint=f"{self.BATCH_CALLING_ENDPOINT}/{job_id}/cancel"
@@ -277,7 +276,7 @@ class BatchCallingService(BaseClient):
             >>> for call in calls.get("calls", []):
             ...     print(f"{call['to_number']}: {call['status']}")
         """
-        with APICallLogger(self.logger, "Get Batch Job Calls", job_id=job_id):
+        with self._apilog("Get Batch Job Calls", job_id=job_id):
             params = {"page_size": page_size}
             
             if status:
@@ -20,6 +20,10 @@ class ElevenLabsConfig:
     timeout: int = field(default_factory=lambda: int(os.getenv("ELEVENLABS_TIMEOUT", "30")))
     max_retries: int = field(default_factory=lambda: int(os.getenv("ELEVENLABS_MAX_RETRIES", "3")))
     retry_delay: float = field(default_factory=lambda: float(os.getenv("ELEVENLABS_RETRY_DELAY", "1.0")))
+
+    # Client-side rate limiting (token bucket; refill is tokens per second)
+    rate_limit_capacity: int = field(default_factory=lambda: int(os.getenv("ELEVENLABS_RATE_LIMIT_CAPACITY", "10")))
+    rate_limit_refill: float = field(default_factory=lambda: float(os.getenv("ELEVENLABS_RATE_LIMIT_REFILL", "5.0")))
     
     # Logging Configuration
     log_level: str = field(default_factory=lambda: os.getenv("ELEVENLABS_LOG_LEVEL", "INFO"))
@@ -7,7 +7,7 @@ from typing import Optional, Dict, Any
 
 from base import BaseClient
 from config import ElevenLabsConfig
-from logger import APICallLogger
+from exceptions import raise_for_status
 
 
 class ConversationService(BaseClient):
@@ -62,7 +62,7 @@ class ConversationService(BaseClient):
             >>> for entry in conv.get("transcript", []):
             ...     print(f"{entry['role']}: {entry['message']}")
         """
-        with APICallLogger(self.logger, "Get Conversation", conversation_id=conversation_id):
+        with self._apilog("Get Conversation", conversation_id=conversation_id):
             response = self._make_request(
                 method="GET",
                 endpoint=f"{self.CONVERSATIONS_ENDPOINT}/{conversation_id}"
@@ -91,9 +91,13 @@ class ConversationService(BaseClient):
             >>> with open("recording.mp3", "wb") as f:
             ...     f.write(audio)
         """
-        with APICallLogger(self.logger, "Get Conversation Audio", conversation_id=conversation_id):
+        with self._apilog("Get Conversation Audio", conversation_id=conversation_id):
             url = f"{self.config.base_url}{self.CONVERSATIONS_ENDPOINT}/{conversation_id}/audio"
-            
+
+            # Direct session get, so pre-gate against the shared bucket
+            # the same way _make_request does
+            self._rate_limiter.acquire()
+
             response = self.session.get(
                 url,
                 headers=self.config.headers,
@@ -101,7 +105,6 @@ class ConversationService(BaseClient):
             )
             
             if not response.ok:
-                from exceptions import raise_for_status
                 try:
                     response_data = response.json()
                 except ValueError:
@@ -115,33 +118,45 @@ class ConversationService(BaseClient):
         self,
         agent_id: Optional[str] = None,
         cursor: Optional[str] = None,
-        page_size: int = 30
+        page_size: int = 100,
+        call_successful: Optional[str] = None,
+        start_after: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         List conversations with optional filtering.
-        
+
         API Endpoint: GET /v1/convai/conversations
-        
+
         Args:
             agent_id: Filter by agent ID (optional)
             cursor: Pagination cursor for next page
-            page_size: Number of results per page (default: 30)
-            
+            page_size: Number of results per page (default: 100)
+            call_successful: Filter by call result ("success", "failure", "unknown")
+            start_after: Only conversations started after this unix timestamp
+
         Returns:
             List of conversations with pagination info
-            
+
+        Note:
+            Filters are applied server-side, so cost scales with matching
+            conversations rather than the full history.
+
         Example:
             >>> result = service.list_conversations(agent_id="agent_abc123")
             >>> for conv in result.get("conversations", []):
             ...     print(f"{conv['conversation_id']}: {conv['status']}")
         """
-        with APICallLogger(self.logger, "List Conversations"):
+        with self._apilog("List Conversations"):
             params = {"page_size": page_size}
             if agent_id:
                 params["agent_id"] = agent_id
             if cursor:
                 params["cursor"] = cursor
-            
+            if call_successful:
+                params["call_successful"] = call_successful
+            if start_after is not None:
+                params["call_start_after_unix"] = start_after
+
             response = self._make_request(
                 method="GET",
                 endpoint=self.CONVERSATIONS_ENDPOINT,
@@ -164,7 +179,7 @@ class ConversationService(BaseClient):
         Returns:
             Deletion confirmation
         """
-        with APICallLogger(self.logger, "Delete Conversation", conversation_id=conversation_id):
+        with self._apilog("Delete Conversation", conversation_id=conversation_id):
             response = self._make_request(
                 method="DELETE",
                 endpoint=f"{self.CONVERSATIONS_ENDPOINT}/{conversation_id}"
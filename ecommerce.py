@@ -3,13 +3,94 @@ Ecommerce integration for voice agents.
 Supports WooCommerce, Shopify, and other platforms dynamically.
 """
 
+import asyncio
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from time import monotonic
 from typing import Optional, Dict, Any, List
-import requests
-from requests.auth import HTTPBasicAuth
+import base64
+
+try:
+    import ijson
+except ImportError:  # optional dependency; buffered parsing is used without it
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # optional dependency; stdlib json is used without it
+    orjson = None
 
 logger = logging.getLogger("elevenlabs.ecommerce")
 
+# Responses smaller than this parse faster buffered than streamed
+STREAM_THRESHOLD_BYTES = 8192
+
+# Cache TTLs per kind; orders change more often than the catalog
+CACHE_TTLS = {"products": 30.0, "orders": 15.0}
+
+# Session clients idle longer than this are evicted with their sockets
+CLIENT_TTL_SECONDS = 3600.0
+
+# One pooled session shared by every EcommerceClient: connection reuse
+# scales with target hosts, not with the number of active call sessions.
+# Holds a requests.Session; requests itself is imported lazily so workers
+# that only use the context stores skip its cold-start cost.
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+
+def _get_shared_session():
+    """Get or create the module-wide pooled requests.Session."""
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                class _LoggingRetry(Retry):
+                    """Retry policy that logs each transient-failure retry."""
+
+                    def increment(self, method=None, url=None, *args, **kwargs):
+                        new_retry = super().increment(method, url, *args, **kwargs)
+                        logger.warning(
+                            "Retrying %s %s (%s retries left)",
+                            method, url, new_retry.total
+                        )
+                        return new_retry
+
+                session = requests.Session()
+                # Retry idempotent GETs on transient failures so a single
+                # 503 doesn't turn into an apology to the caller mid-call
+                retry_strategy = _LoggingRetry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET"],
+                    respect_retry_after_header=True
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=50,
+                    pool_maxsize=200,
+                    max_retries=retry_strategy
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _shared_session = session
+    return _shared_session
+
+
+def close_shared_session() -> None:
+    """Close the shared session and its pooled connections."""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is not None:
+            _shared_session.close()
+            _shared_session = None
+
 
 class EcommerceClient:
     """
@@ -17,7 +98,17 @@ class EcommerceClient:
     """
     
     SUPPORTED_PLATFORMS = ["woocommerce", "shopify"]
-    
+
+    # Only request the fields the formatters actually use. Full payloads
+    # include descriptions, images, and metafields the voice agent never
+    # reads, so this cuts response size and JSON parse time dramatically.
+    _FIELD_FILTERS = {
+        ("woocommerce", "products"): "id,name,price,stock_status,sku",
+        ("woocommerce", "orders"): "id,status,total,date_created,billing",
+        ("shopify", "products"): "id,title,variants",
+        ("shopify", "orders"): "id,name,financial_status,fulfillment_status,total_price,customer",
+    }
+
     def __init__(
         self, 
         platform: str,
@@ -43,10 +134,91 @@ class EcommerceClient:
         self.access_token = access_token
         
         if self.platform not in self.SUPPORTED_PLATFORMS:
-            logger.warning(f"Platform '{self.platform}' may not be fully supported")
-        
-        logger.info(f"EcommerceClient initialized for {self.platform}")
-    
+            logger.warning("Platform '%s' may not be fully supported", self.platform)
+
+        # Pre-build auth/headers once and pass them per request on the shared
+        # session. The Basic header is encoded here directly; HTTPBasicAuth
+        # would re-run the base64 encode on every request.
+        if self.platform == "woocommerce":
+            token = base64.b64encode(
+                f"{self.api_key}:{self.api_secret or ''}".encode()
+            ).decode()
+            self._headers = {"Authorization": f"Basic {token}"}
+        elif self.platform == "shopify":
+            self._headers = {
+                "X-Shopify-Access-Token": self.access_token,
+                "Content-Type": "application/json"
+            }
+        else:
+            self._headers = {}
+
+        # Endpoint URLs are fixed per platform; build them once instead of
+        # re-formatting them on every request
+        if self.platform == "woocommerce":
+            # Handle both formats: base store URL or full API URL
+            if "/wp-json/wc/v3" in self.base_url:
+                api_root = self.base_url
+            else:
+                api_root = f"{self.base_url}/wp-json/wc/v3"
+            self._urls = {
+                "products": f"{api_root}/products",
+                "orders": f"{api_root}/orders"
+            }
+        elif self.platform == "shopify":
+            self._urls = {
+                "products": f"{self.base_url}/admin/api/2024-01/products.json",
+                "orders": f"{self.base_url}/admin/api/2024-01/orders.json"
+            }
+        else:
+            self._urls = {}
+
+        # Resolve the fetch handler once instead of re-checking the platform
+        # string on every call
+        self._supported = self.platform in self.SUPPORTED_PLATFORMS
+        self._fetch_impl = self._fetch if self._supported else self._unsupported
+        self._afetch_impl = self._afetch if self._supported else self._aunsupported
+
+        # Async client is created lazily on first async call
+        self._aclient = None
+
+        # Short-lived result cache: the LLM often re-invokes the same tool
+        # with identical arguments within seconds during a call
+        self._cache: Dict[tuple, tuple] = {}
+
+        logger.info("EcommerceClient initialized for %s", self.platform)
+
+    def _get_aclient(self):
+        """Get or create the shared httpx.AsyncClient for async fetches."""
+        if self._aclient is None:
+            import httpx
+            limits = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+            kwargs = {"timeout": 30, "limits": limits}
+            if self.platform == "woocommerce":
+                kwargs["auth"] = (self.api_key, self.api_secret or "")
+            elif self.platform == "shopify":
+                kwargs["headers"] = {
+                    "X-Shopify-Access-Token": self.access_token,
+                    "Content-Type": "application/json"
+                }
+            try:
+                # HTTP/2 multiplexes concurrent lookups over one connection,
+                # but needs the optional h2 package
+                self._aclient = httpx.AsyncClient(http2=True, **kwargs)
+            except ImportError:
+                self._aclient = httpx.AsyncClient(**kwargs)
+        return self._aclient
+
+    def close(self):
+        """Release client-owned transports (the shared sync session stays up)."""
+        if self._aclient is not None:
+            aclient, self._aclient = self._aclient, None
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.run(aclient.aclose())
+            else:
+                loop.create_task(aclient.aclose())
+
     def get_products(self, limit: int = 5) -> Dict[str, Any]:
         """
         Fetch products from the ecommerce store.
@@ -58,21 +230,20 @@ class EcommerceClient:
             Dict with products list and formatted text
         """
         try:
-            logger.info(f"Fetching {limit} products from {self.platform}...")
-            
-            if self.platform == "woocommerce":
-                return self._get_woocommerce_products(limit)
-            elif self.platform == "shopify":
-                return self._get_shopify_products(limit)
-            else:
-                return {
-                    "success": False,
-                    "error": f"Platform '{self.platform}' is not supported yet.",
-                    "products": []
-                }
-                
+            logger.info("Fetching %d products from %s...", limit, self.platform)
+
+            key = ("products", limit)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+            result = self._fetch_impl("products", limit)
+            if result.get("success"):
+                self._cache_put(key, result)
+            return result
+
         except Exception as e:
-            logger.error(f"Error fetching products: {e}")
+            logger.error("Error fetching products: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -90,226 +261,325 @@ class EcommerceClient:
             Dict with orders list and formatted text
         """
         try:
-            logger.info(f"Fetching {limit} orders from {self.platform}...")
-            
-            if self.platform == "woocommerce":
-                return self._get_woocommerce_orders(limit)
-            elif self.platform == "shopify":
-                return self._get_shopify_orders(limit)
-            else:
-                return {
-                    "success": False,
-                    "error": f"Platform '{self.platform}' is not supported yet.",
-                    "orders": []
-                }
-                
+            logger.info("Fetching %d orders from %s...", limit, self.platform)
+
+            key = ("orders", limit)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+            result = self._fetch_impl("orders", limit)
+            if result.get("success"):
+                self._cache_put(key, result)
+            return result
+
         except Exception as e:
-            logger.error(f"Error fetching orders: {e}")
+            logger.error("Error fetching orders: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "orders": []
             }
     
-    def _get_woocommerce_products(self, limit: int) -> Dict[str, Any]:
-        """Fetch products from WooCommerce."""
-        # Handle both formats: base store URL or full API URL
-        if "/wp-json/wc/v3" in self.base_url:
-            url = f"{self.base_url}/products"
-        else:
-            url = f"{self.base_url}/wp-json/wc/v3/products"
-        params = {"per_page": limit}
-        auth = HTTPBasicAuth(self.api_key, self.api_secret or "")
-        
-        # Debug logging
-        logger.info(f"WooCommerce API Request:")
-        logger.info(f"  URL: {url}")
-        logger.info(f"  API Key: {self.api_key[:10]}..." if self.api_key else "  API Key: None")
-        logger.info(f"  API Secret: {'*' * 10}" if self.api_secret else "  API Secret: None")
-        
-        response = requests.get(url, auth=auth, params=params, timeout=30)
-        logger.info(f"  Response Status: {response.status_code}")
-        
-        if response.status_code == 200:
-            products = response.json()
-            formatted = self._format_woocommerce_products(products)
-            return {
-                "success": True,
-                "products": products,
-                "formatted": formatted,
-                "count": len(products)
-            }
-        else:
-            logger.error(f"Failed to fetch products: {response.status_code}")
-            return {
-                "success": False,
-                "error": f"HTTP {response.status_code}: {response.text}",
-                "products": []
-            }
-    
-    def _get_woocommerce_orders(self, limit: int) -> Dict[str, Any]:
-        """Fetch orders from WooCommerce."""
-        # Handle both formats: base store URL or full API URL
-        if "/wp-json/wc/v3" in self.base_url:
-            url = f"{self.base_url}/orders"
-        else:
-            url = f"{self.base_url}/wp-json/wc/v3/orders"
-        params = {"per_page": limit}
-        auth = HTTPBasicAuth(self.api_key, self.api_secret or "")
-        
-        response = requests.get(url, auth=auth, params=params, timeout=30)
-        
-        if response.status_code == 200:
-            orders = response.json()
-            formatted = self._format_woocommerce_orders(orders)
-            return {
-                "success": True,
-                "orders": orders,
-                "formatted": formatted,
-                "count": len(orders)
-            }
-        else:
-            logger.error(f"Failed to fetch orders: {response.status_code}")
+    def _unsupported(self, kind: str, limit: int) -> Dict[str, Any]:
+        """Fetch handler bound for platforms without an integration."""
+        return {
+            "success": False,
+            "error": f"Platform '{self.platform}' is not supported yet.",
+            kind: []
+        }
+
+    async def _aunsupported(self, kind: str, limit: int) -> Dict[str, Any]:
+        """Async fetch handler bound for platforms without an integration."""
+        return self._unsupported(kind, limit)
+
+    def _cache_get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return a cached result if present and not expired."""
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > monotonic():
+                logger.debug("Cache hit: %s", key)
+                return result
+            del self._cache[key]
+        logger.debug("Cache miss: %s", key)
+        return None
+
+    def _cache_put(self, key: tuple, result: Dict[str, Any]) -> None:
+        """Cache a successful result until its kind-specific TTL expires."""
+        self._cache[key] = (monotonic() + CACHE_TTLS[key[0]], result)
+
+    def invalidate(self) -> None:
+        """Evict all cached results (call after mutating inventory/orders)."""
+        self._cache.clear()
+
+    async def aget_products(self, limit: int = 5) -> Dict[str, Any]:
+        """Async variant of get_products (see get_products)."""
+        return await self._aget("products", limit)
+
+    async def aget_orders(self, limit: int = 5) -> Dict[str, Any]:
+        """Async variant of get_orders (see get_orders)."""
+        return await self._aget("orders", limit)
+
+    async def _aget(self, kind: str, limit: int) -> Dict[str, Any]:
+        """Async counterpart of the get_products/get_orders wrappers."""
+        try:
+            logger.info("Fetching %d %s from %s (async)...", limit, kind, self.platform)
+
+            key = (kind, limit)
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+            result = await self._afetch_impl(kind, limit)
+            if result.get("success"):
+                self._cache_put(key, result)
+            return result
+
+        except Exception as e:
+            logger.error("Error fetching %s: %s", kind, e)
             return {
                 "success": False,
-                "error": f"HTTP {response.status_code}: {response.text}",
-                "orders": []
+                "error": str(e),
+                kind: []
             }
-    
-    def _get_shopify_products(self, limit: int) -> Dict[str, Any]:
-        """Fetch products from Shopify."""
-        url = f"{self.base_url}/admin/api/2024-01/products.json"
-        headers = {
-            "X-Shopify-Access-Token": self.access_token,
-            "Content-Type": "application/json"
-        }
-        params = {"limit": limit}
-        
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        
+
+    async def _afetch(self, kind: str, limit: int) -> Dict[str, Any]:
+        """Async mirror of _fetch using the shared httpx.AsyncClient."""
+        url, params, extract_key = self._build_request(kind, limit)
+
+        logger.debug("%s %s request: %s", self.platform, kind, url)
+
+        response = await self._get_aclient().get(url, params=params)
+
         if response.status_code == 200:
             data = response.json()
-            products = data.get("products", [])
-            formatted = self._format_shopify_products(products)
+            items = data if extract_key is None else data.get(extract_key, [])
+            formatted = self._FORMATTERS[(self.platform, kind)](self, items)
             return {
                 "success": True,
-                "products": products,
+                kind: items,
                 "formatted": formatted,
-                "count": len(products)
+                "count": len(items)
             }
         else:
-            logger.error(f"Failed to fetch products: {response.status_code}")
+            logger.error("Failed to fetch %s: %s", kind, response.status_code)
             return {
                 "success": False,
                 "error": f"HTTP {response.status_code}: {response.text}",
-                "products": []
+                kind: []
             }
-    
-    def _get_shopify_orders(self, limit: int) -> Dict[str, Any]:
-        """Fetch orders from Shopify."""
-        url = f"{self.base_url}/admin/api/2024-01/orders.json"
-        headers = {
-            "X-Shopify-Access-Token": self.access_token,
-            "Content-Type": "application/json"
+
+    def _build_request(self, kind: str, limit: int) -> tuple:
+        """
+        Build request pieces for a platform + kind ("products" or "orders").
+
+        Returns:
+            Tuple of (url, params, extract_key) where extract_key is the
+            response key holding the item list (None for top-level arrays)
+        """
+        url = self._urls[kind]
+        params = self._params_for(self.platform, kind, limit)
+        extract_key = None if self.platform == "woocommerce" else kind
+        return url, params, extract_key
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _params_for(platform: str, kind: str, limit: int) -> Dict[str, Any]:
+        """
+        Build (and memoize) the query params for a platform + kind + limit.
+
+        The limit cap upstream keeps the argument space tiny, so repeated
+        calls reuse the same dict instead of allocating a fresh one.
+        requests only reads params, so sharing is safe.
+        """
+        fields = EcommerceClient._FIELD_FILTERS[(platform, kind)]
+        if platform == "woocommerce":
+            return {"per_page": limit, "_fields": fields}
+        # shopify
+        params = {
+            "limit": min(limit, 250),  # Shopify's hard page-size ceiling
+            "fields": fields
         }
-        params = {"limit": limit, "status": "any"}
-        
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        
+        if kind == "orders":
+            params["status"] = "any"
+        return params
+
+    def _fetch(self, kind: str, limit: int) -> Dict[str, Any]:
+        """
+        Shared fetch path for products/orders across all platforms.
+
+        Args:
+            kind: "products" or "orders"
+            limit: Number of items to fetch
+
+        Returns:
+            Dict with items list and formatted text
+        """
+        url, params, extract_key = self._build_request(kind, limit)
+
+        logger.debug("%s %s request: %s", self.platform, kind, url)
+
+        response = _get_shared_session().get(
+            url, headers=self._headers, params=params, timeout=30,
+            stream=ijson is not None
+        )
+
         if response.status_code == 200:
-            data = response.json()
-            orders = data.get("orders", [])
-            formatted = self._format_shopify_orders(orders)
+            items = self._parse_items(response, extract_key, limit)
+            formatted = self._FORMATTERS[(self.platform, kind)](self, items)
             return {
                 "success": True,
-                "orders": orders,
+                kind: items,
                 "formatted": formatted,
-                "count": len(orders)
+                "count": len(items)
             }
         else:
-            logger.error(f"Failed to fetch orders: {response.status_code}")
+            logger.error("Failed to fetch %s: %s", kind, response.status_code)
             return {
                 "success": False,
                 "error": f"HTTP {response.status_code}: {response.text}",
-                "orders": []
+                kind: []
             }
-    
+
+    @staticmethod
+    def _parse_items(response, extract_key: Optional[str], limit: int) -> List[Dict]:
+        """
+        Decode the item list from a 200 response.
+
+        Large bodies are streamed incrementally with ijson (when installed)
+        so parsing overlaps the download and stops once `limit` items are
+        decoded; small bodies take the plain buffered json() fast path.
+        """
+        try:
+            content_length = int(response.headers.get("Content-Length", 0))
+        except (TypeError, ValueError):
+            content_length = 0
+
+        if ijson is not None and content_length >= STREAM_THRESHOLD_BYTES:
+            # Undo transport compression before the incremental parser sees it
+            response.raw.decode_content = True
+            prefix = "item" if extract_key is None else f"{extract_key}.item"
+            items = []
+            for item in ijson.items(response.raw, prefix):
+                items.append(item)
+                if len(items) >= limit:
+                    break
+            return items
+
+        # orjson decodes the dict-heavy store payloads several times faster
+        # than the stdlib decoder behind response.json()
+        if orjson is not None:
+            data = orjson.loads(response.content)
+        else:
+            data = response.json()
+        items = data if extract_key is None else data.get(extract_key, [])
+        # Never format/return more than the caller asked for, even when the
+        # server sends a fuller page than requested
+        return items[:limit] if len(items) > limit else items
+
     def _format_woocommerce_products(self, products: List[Dict]) -> str:
         """Format WooCommerce products into readable text."""
         if not products:
             return "No products found."
-        
-        result = f"Found {len(products)} products:\n"
-        for p in products:
+
+        # Pre-size the parts list (one header + one entry per product) so the
+        # loop fills slots instead of growing the list, and len() runs once.
+        n = len(products)
+        parts = [None] * (n + 1)
+        parts[0] = f"Found {n} products:\n"
+        for i, p in enumerate(products, 1):
             name = p.get('name', 'Unknown')
             price = p.get('price', '0')
             stock_status = p.get('stock_status', 'unknown')
             sku = p.get('sku', 'N/A')
-            result += f"\n- {name}\n"
-            result += f"  Price: ${price}\n"
-            result += f"  SKU: {sku}\n"
-            result += f"  Stock: {stock_status}\n"
-        
-        return result
-    
+            parts[i] = (
+                f"\n- {name}\n"
+                f"  Price: ${price}\n"
+                f"  SKU: {sku}\n"
+                f"  Stock: {stock_status}\n"
+            )
+
+        return "".join(parts)
+
     def _format_woocommerce_orders(self, orders: List[Dict]) -> str:
         """Format WooCommerce orders into readable text."""
         if not orders:
             return "No orders found."
-        
-        result = f"Found {len(orders)} recent orders:\n"
-        for o in orders:
+
+        n = len(orders)
+        parts = [None] * (n + 1)
+        parts[0] = f"Found {n} recent orders:\n"
+        for i, o in enumerate(orders, 1):
             order_id = o.get('id', 'Unknown')
             status = o.get('status', 'unknown')
             total = o.get('total', '0')
             date = o.get('date_created', 'Unknown')
             customer = o.get('billing', {})
             customer_name = f"{customer.get('first_name', '')} {customer.get('last_name', '')}".strip()
-            result += f"\n- Order #{order_id}\n"
-            result += f"  Customer: {customer_name or 'Unknown'}\n"
-            result += f"  Status: {status}\n"
-            result += f"  Total: ${total}\n"
-            result += f"  Date: {date}\n"
-        
-        return result
-    
+            parts[i] = (
+                f"\n- Order #{order_id}\n"
+                f"  Customer: {customer_name or 'Unknown'}\n"
+                f"  Status: {status}\n"
+                f"  Total: ${total}\n"
+                f"  Date: {date}\n"
+            )
+
+        return "".join(parts)
+
     def _format_shopify_products(self, products: List[Dict]) -> str:
         """Format Shopify products into readable text."""
         if not products:
             return "No products found."
-        
-        result = f"Found {len(products)} products:\n"
-        for p in products:
+
+        n = len(products)
+        parts = [None] * (n + 1)
+        parts[0] = f"Found {n} products:\n"
+        for i, p in enumerate(products, 1):
             title = p.get('title', 'Unknown')
             variants = p.get('variants', [])
             price = variants[0].get('price', '0') if variants else '0'
             inventory = variants[0].get('inventory_quantity', 0) if variants else 0
-            result += f"\n- {title}\n"
-            result += f"  Price: ${price}\n"
-            result += f"  Inventory: {inventory}\n"
-        
-        return result
-    
+            parts[i] = (
+                f"\n- {title}\n"
+                f"  Price: ${price}\n"
+                f"  Inventory: {inventory}\n"
+            )
+
+        return "".join(parts)
+
     def _format_shopify_orders(self, orders: List[Dict]) -> str:
         """Format Shopify orders into readable text."""
         if not orders:
             return "No orders found."
-        
-        result = f"Found {len(orders)} recent orders:\n"
-        for o in orders:
+
+        n = len(orders)
+        parts = [None] * (n + 1)
+        parts[0] = f"Found {n} recent orders:\n"
+        for i, o in enumerate(orders, 1):
             name = o.get('name', 'Unknown')
             status = o.get('financial_status', 'unknown')
             fulfillment = o.get('fulfillment_status', 'unfulfilled') or 'unfulfilled'
             total = o.get('total_price', '0')
             customer = o.get('customer', {})
             customer_name = f"{customer.get('first_name', '')} {customer.get('last_name', '')}".strip()
-            result += f"\n- Order {name}\n"
-            result += f"  Customer: {customer_name or 'Unknown'}\n"
-            result += f"  Payment: {status}\n"
-            result += f"  Fulfillment: {fulfillment}\n"
-            result += f"  Total: ${total}\n"
-        
-        return result
+            parts[i] = (
+                f"\n- Order {name}\n"
+                f"  Customer: {customer_name or 'Unknown'}\n"
+                f"  Payment: {status}\n"
+                f"  Fulfillment: {fulfillment}\n"
+                f"  Total: ${total}\n"
+            )
+
+        return "".join(parts)
+
+    # Formatter dispatch table for the shared _fetch path
+    _FORMATTERS = {
+        ("woocommerce", "products"): _format_woocommerce_products,
+        ("woocommerce", "orders"): _format_woocommerce_orders,
+        ("shopify", "products"): _format_shopify_products,
+        ("shopify", "orders"): _format_shopify_orders,
+    }
 
 
 class EcommerceService:
@@ -320,7 +590,29 @@ class EcommerceService:
     def __init__(self):
         """Initialize ecommerce service."""
         self._clients: Dict[str, EcommerceClient] = {}
+        # session_id -> last access time, for TTL eviction of idle clients
+        self._last_used: Dict[str, float] = {}
+        # Shared pool for fan-out across sessions; requests releases the GIL
+        # during network I/O so threads overlap the round-trips
+        self._pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="ecom")
         logger.info("EcommerceService initialized")
+
+    def _evict_stale(self):
+        """Drop clients idle past CLIENT_TTL_SECONDS, closing their sockets."""
+        cutoff = monotonic() - CLIENT_TTL_SECONDS
+        for session_id, last_used in list(self._last_used.items()):
+            if last_used < cutoff:
+                self._last_used.pop(session_id, None)
+                stale = self._clients.pop(session_id, None)
+                if stale:
+                    stale.close()
+                    logger.info("Evicted idle ecommerce client for session %s", session_id)
+
+    def close(self):
+        """Shut down the worker pool and close all clients."""
+        self._pool.shutdown(wait=False)
+        for session_id in list(self._clients):
+            self.remove_client(session_id)
     
     def create_client(
         self,
@@ -345,6 +637,20 @@ class EcommerceService:
         Returns:
             EcommerceClient instance
         """
+        # Reuse the existing client (and its connection pool) when the
+        # session reconnects with the same credentials
+        existing = self._clients.get(session_id)
+        if (existing
+                and existing.platform == platform.lower()
+                and existing.base_url == base_url.rstrip('/')
+                and existing.api_key == api_key
+                and existing.api_secret == api_secret
+                and existing.access_token == access_token):
+            self._last_used[session_id] = monotonic()
+            return existing
+        if existing:
+            existing.close()
+
         client = EcommerceClient(
             platform=platform,
             base_url=base_url,
@@ -353,18 +659,25 @@ class EcommerceService:
             access_token=access_token
         )
         self._clients[session_id] = client
-        logger.info(f"Created ecommerce client for session {session_id}")
+        self._last_used[session_id] = monotonic()
+        self._evict_stale()
+        logger.info("Created ecommerce client for session %s", session_id)
         return client
-    
+
     def get_client(self, session_id: str) -> Optional[EcommerceClient]:
         """Get ecommerce client for a session."""
-        return self._clients.get(session_id)
-    
+        client = self._clients.get(session_id)
+        if client:
+            self._last_used[session_id] = monotonic()
+        return client
+
     def remove_client(self, session_id: str):
         """Remove ecommerce client for a session."""
-        if session_id in self._clients:
-            del self._clients[session_id]
-            logger.info(f"Removed ecommerce client for session {session_id}")
+        self._last_used.pop(session_id, None)
+        client = self._clients.pop(session_id, None)
+        if client:
+            client.close()
+            logger.info("Removed ecommerce client for session %s", session_id)
     
     def get_products(
         self,
@@ -416,17 +729,113 @@ class EcommerceService:
         
         return client.get_orders(limit=min(limit, 20))
 
+    def get_products_bulk(
+        self,
+        session_ids: List[str],
+        limit: int = 5
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch products for many sessions concurrently.
 
-# Global service instance
-_ecommerce_service: Optional[EcommerceService] = None
+        Args:
+            session_ids: Session identifiers to fetch for
+            limit: Number of products to fetch per session
+
+        Returns:
+            Dict mapping session_id to its products result dict
+        """
+        return self._fetch_bulk("get_products", session_ids, limit)
+
+    def get_orders_bulk(
+        self,
+        session_ids: List[str],
+        limit: int = 5
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch orders for many sessions concurrently.
+
+        Args:
+            session_ids: Session identifiers to fetch for
+            limit: Number of orders to fetch per session
+
+        Returns:
+            Dict mapping session_id to its orders result dict
+        """
+        return self._fetch_bulk("get_orders", session_ids, limit)
+
+    def _fetch_bulk(
+        self,
+        method_name: str,
+        session_ids: List[str],
+        limit: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fan a client method out over the thread pool, one task per session."""
+        limit = min(limit, 20)
+        futures = {}
+        results: Dict[str, Dict[str, Any]] = {}
+
+        for session_id in session_ids:
+            client = self.get_client(session_id)
+            if client:
+                futures[session_id] = self._pool.submit(
+                    getattr(client, method_name), limit
+                )
+            else:
+                results[session_id] = {
+                    "success": False,
+                    "error": "No ecommerce platform connected for this session"
+                }
+
+        for session_id, future in futures.items():
+            try:
+                results[session_id] = future.result()
+            except Exception as e:
+                logger.error("Bulk fetch failed for session %s: %s", session_id, e)
+                results[session_id] = {"success": False, "error": str(e)}
+
+        return results
+
+    async def get_products_and_orders(
+        self,
+        session_id: str,
+        limit: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Fetch products and orders for a session concurrently.
+
+        Both lookups run in parallel on the client's async transport, so
+        the combined latency is one round-trip instead of two.
+
+        Args:
+            session_id: Session identifier
+            limit: Number of items to fetch per kind
 
+        Returns:
+            Dict with "products" and "orders" result dicts
+        """
+        client = self.get_client(session_id)
+        if not client:
+            error = {
+                "success": False,
+                "error": "No ecommerce platform connected for this session"
+            }
+            return {
+                "products": {**error, "products": []},
+                "orders": {**error, "orders": []}
+            }
+
+        limit = min(limit, 20)
+        products, orders = await asyncio.gather(
+            client.aget_products(limit),
+            client.aget_orders(limit)
+        )
+        return {"products": products, "orders": orders}
 
+
+@lru_cache(maxsize=1)
 def get_ecommerce_service() -> EcommerceService:
     """Get or create the global ecommerce service."""
-    global _ecommerce_service
-    if _ecommerce_service is None:
-        _ecommerce_service = EcommerceService()
-    return _ecommerce_service
+    return EcommerceService()
 
 
 # =============================================================================
@@ -441,12 +850,16 @@ class BatchJobContextStore:
     
     def __init__(self):
         """Initialize batch job context store."""
+        # Guards multi-dict writes; webhook handlers run on several threads
+        self._lock = threading.RLock()
         # job_id -> {ecommerce_credentials, sender_email, agent_id}
         self._jobs: Dict[str, Dict[str, Any]] = {}
         # agent_id -> job_id (most recent)
         self._agent_jobs: Dict[str, str] = {}
         # phone_number -> {name, email, job_id}
         self._recipients: Dict[str, Dict[str, Any]] = {}
+        # job_id -> set of phone numbers, so job removal is O(job recipients)
+        self._job_recipients: Dict[str, set] = {}
         logger.info("BatchJobContextStore initialized")
     
     def store_job(
@@ -467,27 +880,31 @@ class BatchJobContextStore:
             sender_email: Sender email for email templates
             recipients: List of recipients with name/email
         """
-        self._jobs[job_id] = {
-            "agent_id": agent_id,
-            "ecommerce_credentials": ecommerce_credentials,
-            "sender_email": sender_email
-        }
-        self._agent_jobs[agent_id] = job_id
-        
-        # Store recipient info by phone number
-        if recipients:
-            for r in recipients:
-                phone = r.get("phone_number")
-                if phone:
-                    self._recipients[phone] = {
-                        "name": r.get("name"),
-                        "email": r.get("email"),
-                        "job_id": job_id,
-                        "agent_id": agent_id,
-                        "dynamic_variables": r.get("dynamic_variables")
-                    }
-        
-        logger.info(f"Stored batch job context: job_id={job_id}, agent_id={agent_id}, recipients={len(recipients or [])}")
+        with self._lock:
+            self._jobs[job_id] = {
+                "agent_id": agent_id,
+                "ecommerce_credentials": ecommerce_credentials,
+                "sender_email": sender_email
+            }
+            self._agent_jobs[agent_id] = job_id
+
+            # Store recipient info by phone number
+            if recipients:
+                job_phones = self._job_recipients.setdefault(job_id, set())
+                for r in recipients:
+                    phone = r.get("phone_number")
+                    if phone:
+                        self._recipients[phone] = {
+                            "name": r.get("name"),
+                            "email": r.get("email"),
+                            "job_id": job_id,
+                            "agent_id": agent_id,
+                            "dynamic_variables": r.get("dynamic_variables")
+                        }
+                        job_phones.add(phone)
+
+
+        logger.info("Stored batch job context: job_id=%s, agent_id=%s, recipients=%d", job_id, agent_id, len(recipients or []))
     
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get batch job context by job ID."""
@@ -499,8 +916,9 @@ class BatchJobContextStore:
         if job_id:
             job = self._jobs.get(job_id)
             if job:
-                job["job_id"] = job_id
-                return job
+                # Return a copy; writing job_id into the stored dict would
+                # leak it into every subsequent lookup
+                return {**job, "job_id": job_id}
         return None
     
     def get_recipient_by_phone(self, phone_number: str) -> Optional[Dict[str, Any]]:
@@ -523,32 +941,32 @@ class BatchJobContextStore:
     
     def remove_job(self, job_id: str) -> None:
         """Remove batch job context."""
-        job = self._jobs.get(job_id)
-        if job:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job:
+                return
+
             agent_id = job.get("agent_id")
             if agent_id and self._agent_jobs.get(agent_id) == job_id:
                 del self._agent_jobs[agent_id]
             del self._jobs[job_id]
-            
-            # Clean up recipients for this job
-            to_remove = [phone for phone, info in self._recipients.items() if info.get("job_id") == job_id]
-            for phone in to_remove:
-                del self._recipients[phone]
-            
-            logger.info(f"Removed batch job context: job_id={job_id}")
+
+            # Clean up recipients via the reverse index instead of scanning
+            # every recipient of every job
+            for phone in self._job_recipients.pop(job_id, ()):
+                # Only drop entries still owned by this job; a later job may
+                # have re-registered the same phone number
+                if self._recipients.get(phone, {}).get("job_id") == job_id:
+                    del self._recipients[phone]
+
+        logger.info("Removed batch job context: job_id=%s", job_id)
     
     def list_jobs(self) -> Dict[str, Dict[str, Any]]:
         """List all batch job contexts (for debugging)."""
         return self._jobs.copy()
 
 
-# Global batch job context store
-_batch_job_context: Optional[BatchJobContextStore] = None
-
-
+@lru_cache(maxsize=1)
 def get_batch_job_context() -> BatchJobContextStore:
     """Get or create the global batch job context store."""
-    global _batch_job_context
-    if _batch_job_context is None:
-        _batch_job_context = BatchJobContextStore()
-    return _batch_job_context
+    return BatchJobContextStore()
@@ -6,16 +6,29 @@ Templates are stored in memory but can be auto-loaded from a config file
 (email_templates_config.json) on startup to persist across server restarts.
 """
 
+import sys
 import uuid
 import re
 import json
 import os
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field, asdict
+import asyncio
+import threading
+import mmap
+import time
+from typing import Dict, Any, Optional, List, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from functools import lru_cache, cached_property
 import logging
-import requests
+
+try:
+    import orjson  # C JSON parser; optional fast path for config loads
+except ImportError:
+    orjson = None
 
 from config import ElevenLabsConfig
 from tools import ToolsService
@@ -26,8 +39,140 @@ logger = logging.getLogger(__name__)
 # Path to the config file
 CONFIG_FILE_PATH = Path(__file__).parent / "email_templates_config.json"
 
+def _read_config_file() -> Dict[str, Any]:
+    """Parse the config file, using orjson when available."""
+    if orjson is not None:
+        # Map the file and hand the parser a view of the page cache
+        # directly, skipping the intermediate bytes copy
+        with open(CONFIG_FILE_PATH, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return orjson.loads(memoryview(mm))
+    return json.loads(CONFIG_FILE_PATH.read_bytes())
+
+
+# Matches {{placeholder}} or {placeholder}; compiled once so template fills
+# don't re-run pattern compilation per key per call. Placeholder names are
+# always ASCII identifiers, so re.ASCII skips Unicode \w tables
+PLACEHOLDER_PATTERN = re.compile(r'\{\{?\s*(\w+)\s*\}?\}', re.ASCII)
+
+@lru_cache(maxsize=32)
+def _send_headers(user_email: str) -> Dict[str, str]:
+    """Headers for the external email API, built once per sender."""
+    return {
+        "accept": "application/json",
+        "Content-Type": "application/json",
+        "x-user-email": user_email
+    }
+
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize a payload to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+# ISO timestamp cached for one second; bulk template creation coalesces
+# the datetime allocation and formatting
+_ts_cache = [0.0, ""]
+
+
+def _now_iso() -> str:
+    """Current UTC time in ISO format, cached at second granularity."""
+    t = time.time()
+    if t - _ts_cache[0] > 1.0:
+        _ts_cache[0] = t
+        _ts_cache[1] = datetime.utcfromtimestamp(t).isoformat()
+    return _ts_cache[1]
+
+
+# Placeholders filled from the customer session rather than tool arguments
+_SESSION_FIELDS = frozenset({"customer_name", "customer_email", "name", "email"})
+
+# System dynamic variables attached to every email webhook tool; identical
+# for all templates, so built once at import
+_SYSTEM_PARAMS = (
+    {
+        "name": "conversation_id",
+        "type": "string",
+        "description": "Conversation ID",
+        "required": True,
+        "dynamic_variable": "system__conversation_id"
+    },
+    {
+        "name": "agent_id",
+        "type": "string",
+        "description": "Agent ID",
+        "required": True,
+        "dynamic_variable": "system__agent_id"
+    },
+    {
+        "name": "called_number",
+        "type": "string",
+        "description": "Recipient phone number",
+        "required": True,
+        "dynamic_variable": "system__called_number"
+    }
+)
+
+
+# Shared pooled session for sync sends; created lazily so importing this
+# module doesn't pay for the requests import chain
+_sync_session = None
 
-@dataclass
+
+def _get_sync_session():
+    """Get or create the pooled requests.Session for sync sends."""
+    global _sync_session
+    if _sync_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504]
+            )
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _sync_session = session
+    return _sync_session
+
+
+# Shared async HTTP client for the external email API; created lazily so
+# importing this module doesn't open sockets
+_async_client = None
+
+
+def _get_async_client():
+    """Get or create the shared httpx.AsyncClient."""
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        import httpx
+        limits = httpx.Limits(max_keepalive_connections=32)
+        try:
+            _async_client = httpx.AsyncClient(http2=True, timeout=30, limits=limits)
+        except ImportError:
+            # http2 extra (h2) not installed; HTTP/1.1 keep-alive still
+            # reuses connections
+            _async_client = httpx.AsyncClient(timeout=30, limits=limits)
+    return _async_client
+
+
+class _SafeDict(dict):
+    """format_map lookup that leaves unknown placeholders in place."""
+
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+
+@dataclass(slots=True)
 class EmailTemplateParameter:
     """Parameter definition for email template."""
     name: str
@@ -35,7 +180,7 @@ class EmailTemplateParameter:
     required: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailTemplate:
     """Email template definition."""
     template_id: str
@@ -45,9 +190,28 @@ class EmailTemplate:
     body_template: str
     parameters: List[EmailTemplateParameter] = field(default_factory=list)
     tool_id: Optional[str] = None  # ElevenLabs tool ID once created
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = field(default_factory=_now_iso)
     sender_email: Optional[str] = None  # Default sender for inbound (when not passed at call time)
-    
+    parameter_names: frozenset = field(init=False, repr=False, default=frozenset())
+    # Normalized {name}-form templates; populated in __post_init__ and
+    # declared as fields so they get slots
+    _subject_fmt: str = field(init=False, repr=False, default="")
+    _body_fmt: str = field(init=False, repr=False, default="")
+
+    def __post_init__(self):
+        """Normalize templates to str.format placeholders once at creation."""
+        # {{name}} and { name } both become {name}, so filling can use the
+        # C-implemented str.format_map instead of regex substitution
+        self._subject_fmt = PLACEHOLDER_PATTERN.sub(r'{\1}', self.subject_template)
+        self._body_fmt = PLACEHOLDER_PATTERN.sub(r'{\1}', self.body_template)
+        # Placeholder names across subject and body, extracted once per
+        # template lifetime instead of rescanned per caller
+        self.parameter_names = frozenset(
+            m.group(1)
+            for source in (self.subject_template, self.body_template)
+            for m in PLACEHOLDER_PATTERN.finditer(source)
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -56,12 +220,19 @@ class EmailTemplate:
             "description": self.description,
             "subject_template": self.subject_template,
             "body_template": self.body_template,
-            "parameters": [asdict(p) for p in self.parameters],
+            "parameters": [
+                {"name": p.name, "description": p.description, "required": p.required}
+                for p in self.parameters
+            ],
             "tool_id": self.tool_id,
             "created_at": self.created_at,
             "sender_email": self.sender_email
         }
     
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes for persistence or caching layers."""
+        return _dumps(self.to_dict())
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "EmailTemplate":
         """Create from dictionary."""
@@ -74,7 +245,7 @@ class EmailTemplate:
             body_template=data["body_template"],
             parameters=params,
             tool_id=data.get("tool_id"),
-            created_at=data.get("created_at", datetime.utcnow().isoformat()),
+            created_at=data.get("created_at", _now_iso()),
             sender_email=data.get("sender_email")
         )
 
@@ -83,33 +254,73 @@ class CustomerSessionStore:
     """
     In-memory store for customer session data.
     Maps conversation_id to customer info (name, email, etc.)
+
+    Bounded by LRU eviction plus a time-to-live, so conversations that
+    never hit the cleanup path (network drops) can't grow memory without
+    limit and stale entries age out even below the size cap.
     """
-    
-    def __init__(self):
-        self._sessions: Dict[str, Dict[str, Any]] = {}
+
+    def __init__(self, max_sessions: int = 10_000, ttl_seconds: float = 24 * 3600):
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._max_sessions = max_sessions
+        self._ttl_seconds = ttl_seconds
         self.logger = logging.getLogger(f"{__name__}.CustomerSessionStore")
-    
+
     def store(self, conversation_id: str, customer_info: Dict[str, Any]) -> None:
         """Store customer info for a conversation."""
-        self._sessions[conversation_id] = {
-            **customer_info,
-            "stored_at": datetime.utcnow().isoformat()
-        }
+        # Canonicalize name/email aliases once here so the send path can
+        # read fixed keys instead of chaining fallback lookups per email
+        info = dict(customer_info)
+        info["customer_name"] = info.get("name", info.get("customer_name", ""))
+        info["customer_email"] = info.get("email", info.get("customer_email", ""))
+        info["name"] = info["customer_name"]
+        info["email"] = info["customer_email"]
+        # Raw epoch float; ISO formatting happens only on demand via
+        # format_stored_at, so the hot store path skips datetime work
+        info["stored_at"] = time.time()
+        self._sessions[conversation_id] = info
+        self._sessions.move_to_end(conversation_id)
+        if len(self._sessions) > self._max_sessions:
+            evicted, _ = self._sessions.popitem(last=False)
+            self.logger.warning(f"Session store full, evicted oldest conversation {evicted}")
         self.logger.info(f"Stored customer info for conversation {conversation_id}")
-    
+
     def get(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Get customer info for a conversation."""
-        return self._sessions.get(conversation_id)
+        info = self._sessions.get(conversation_id)
+        if info is None:
+            return None
+        stored_at = info.get("stored_at")
+        if isinstance(stored_at, (int, float)) and time.time() - stored_at > self._ttl_seconds:
+            # Expired entry; drop it rather than serve stale customer data
+            self._sessions.pop(conversation_id, None)
+            self.logger.info(f"Session for conversation {conversation_id} expired")
+            return None
+        # Mark as recently used so active conversations survive eviction
+        self._sessions.move_to_end(conversation_id)
+        return info
     
     def remove(self, conversation_id: str) -> None:
         """Remove customer session."""
-        if conversation_id in self._sessions:
-            del self._sessions[conversation_id]
+        if self._sessions.pop(conversation_id, None) is not None:
             self.logger.info(f"Removed session for conversation {conversation_id}")
     
     def list_all(self) -> Dict[str, Dict[str, Any]]:
-        """List all sessions (for debugging)."""
-        return self._sessions.copy()
+        """
+        List all sessions as a read-only view (for debugging).
+
+        Returns a zero-copy MappingProxyType; callers needing a mutable
+        snapshot can dict() it. stored_at values are epoch floats — use
+        format_stored_at for a readable timestamp.
+        """
+        return MappingProxyType(self._sessions)
+
+    @staticmethod
+    def format_stored_at(stored_at: Any) -> Any:
+        """Convert an epoch float to an ISO timestamp on demand."""
+        if isinstance(stored_at, (int, float)):
+            return datetime.utcfromtimestamp(stored_at).isoformat()
+        return stored_at
 
 
 class EmailTemplateService:
@@ -117,37 +328,107 @@ class EmailTemplateService:
     Service for managing email templates and creating webhook tools.
     """
     
-    def __init__(self, config: ElevenLabsConfig, webhook_base_url: str):
+    def __init__(self, config: ElevenLabsConfig, webhook_base_url: str, max_templates: int = 10_000):
         """
         Initialize email template service.
-        
+
         Args:
             config: ElevenLabs configuration
             webhook_base_url: Base URL for webhooks (e.g., https://your-ngrok.ngrok-free.app/api/v1)
+            max_templates: Cap on stored templates; oldest are evicted past this
         """
         self.config = config
         self.webhook_base_url = webhook_base_url.rstrip("/")
-        self.tools_service = ToolsService(config)
         self.logger = logging.getLogger(f"{__name__}.EmailTemplateService")
-        
-        # In-memory template storage (use database in production)
-        self._templates: Dict[str, EmailTemplate] = {}
-    
-    def _extract_placeholders(self, template: str) -> List[str]:
+
+        # In-memory template storage (use database in production); LRU-bounded
+        # so multi-tenant template churn can't grow memory unchecked
+        self._templates: "OrderedDict[str, EmailTemplate]" = OrderedDict()
+        self._max_templates = max_templates
+
+        # Reverse index so webhook handlers can resolve a tool_id without
+        # scanning every template
+        self._templates_by_tool: Dict[str, EmailTemplate] = {}
+
+        # Set once load_templates_from_config has run for this instance
+        self._templates_loaded = False
+
+        # Rendered (subject, body) pairs keyed by template + values; batch
+        # campaigns send the same filled template to many recipients
+        self._render_cache: Dict[tuple, tuple] = {}
+
+        # Batched delivery queue; created lazily because there is no event
+        # loop at construction time
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @cached_property
+    def tools_service(self) -> ToolsService:
+        """ToolsService built on first use; render/send-only callers skip it."""
+        return ToolsService(self.config)
+
+    def _extract_placeholders(self, template: str) -> set:
         """Extract placeholder names from template string."""
-        # Match {{placeholder}} or {placeholder}
-        pattern = r'\{\{?\s*(\w+)\s*\}?\}'
-        return list(set(re.findall(pattern, template)))
-    
+        if '{' not in template:
+            return set()
+        return {m.group(1) for m in PLACEHOLDER_PATTERN.finditer(template)}
+
     def _fill_template(self, template: str, values: Dict[str, Any]) -> str:
-        """Fill template placeholders with values."""
-        result = template
-        for key, value in values.items():
-            # Replace both {{key}} and {key}
-            result = re.sub(r'\{\{\s*' + key + r'\s*\}\}', str(value), result)
-            result = re.sub(r'\{\s*' + key + r'\s*\}', str(value), result)
-        return result
-    
+        """Fill template placeholders with values in a single pass."""
+        # memchr-speed check; skip the regex engine entirely for
+        # placeholder-free strings
+        if '{' not in template:
+            return template
+        # One scan of the template, replacing both {{key}} and {key};
+        # placeholders without a value are left as-is
+        return PLACEHOLDER_PATTERN.sub(
+            lambda m: str(values[m.group(1)]) if m.group(1) in values else m.group(0),
+            template
+        )
+
+    _RENDER_CACHE_MAX = 256
+
+    def _render(self, template: EmailTemplate, values: Dict[str, Any]) -> tuple:
+        """Fill subject and body, reusing cached renders for repeat values."""
+        try:
+            key = (
+                template.template_id,
+                frozenset((k, str(v)) for k, v in values.items())
+            )
+        except TypeError:
+            key = None
+
+        if key is not None:
+            cached = self._render_cache.get(key)
+            if cached is not None:
+                return cached
+
+        safe_values = _SafeDict((k, str(v)) for k, v in values.items())
+        try:
+            rendered = (
+                template._subject_fmt.format_map(safe_values),
+                template._body_fmt.format_map(safe_values)
+            )
+        except (ValueError, IndexError, KeyError, AttributeError, TypeError):
+            # Literal braces or attribute/index placeholders the old
+            # regex ignored ({user.name}, {items[0]}) defeat format
+            # parsing; fall back to C-level str.replace over the
+            # normalized form, only for keys that actually appear in
+            # the template
+            subject = template._subject_fmt
+            body = template._body_fmt
+            for k in values.keys() & template.parameter_names:
+                v = str(values[k])
+                subject = subject.replace('{' + k + '}', v)
+                body = body.replace('{' + k + '}', v)
+            rendered = (subject, body)
+
+        if key is not None:
+            if len(self._render_cache) >= self._RENDER_CACHE_MAX:
+                self._render_cache.clear()
+            self._render_cache[key] = rendered
+        return rendered
+
     def create_template(
         self,
         name: str,
@@ -173,45 +454,45 @@ class EmailTemplateService:
         Returns:
             Created EmailTemplate
         """
-        # Generate template ID
-        template_id = name.lower().replace(" ", "_").replace("-", "_")
-        
-        # Auto-extract parameters if not provided
-        if parameters is None:
-            # Extract from both subject and body
-            all_placeholders = set(self._extract_placeholders(subject_template))
-            all_placeholders.update(self._extract_placeholders(body_template))
-            
-            # Remove customer_name and customer_email as they come from session
-            session_fields = {"customer_name", "customer_email", "name", "email"}
-            tool_placeholders = all_placeholders - session_fields
-            
-            parameters = [
-                {"name": p, "description": f"Value for {p}", "required": True}
-                for p in sorted(tool_placeholders)
-            ]
-        
-        # Create parameter objects
-        param_objects = [EmailTemplateParameter(**p) for p in parameters]
-        
-        # Create template
+        # Generate template ID; interned so repeated dict lookups compare
+        # by pointer
+        template_id = sys.intern(name.lower().replace(" ", "_").replace("-", "_"))
+
+        # Create template (extracts placeholder names in __post_init__)
         template = EmailTemplate(
             template_id=template_id,
             name=name,
             description=description,
             subject_template=subject_template,
             body_template=body_template,
-            parameters=param_objects,
             sender_email=sender_email
         )
-        
+
+        # Auto-extract parameters if not provided
+        if parameters is None:
+            # Remove customer_name and customer_email as they come from session
+            tool_placeholders = template.parameter_names - _SESSION_FIELDS
+
+            parameters = [
+                {"name": p, "description": f"Value for {p}", "required": True}
+                for p in sorted(tool_placeholders)
+            ]
+
+        # Create parameter objects
+        template.parameters = [EmailTemplateParameter(**p) for p in parameters]
+
         # Create ElevenLabs webhook tool if requested
         if auto_create_tool:
             tool_id = self._create_webhook_tool(template)
             template.tool_id = tool_id
         
-        # Store template
+        # Store template; drop any renders cached for a prior definition
         self._templates[template_id] = template
+        self._templates.move_to_end(template_id)
+        if template.tool_id:
+            self._templates_by_tool[template.tool_id] = template
+        self._render_cache.clear()
+        self._evict_over_cap()
         self.logger.info(f"Created email template: {template_id} with tool_id: {template.tool_id}")
         
         return template
@@ -220,41 +501,21 @@ class EmailTemplateService:
         """Create ElevenLabs webhook tool for this template."""
         webhook_url = f"{self.webhook_base_url}/webhooks/email/{template.template_id}"
         
-        # Build parameters for the tool
-        # Include system dynamic variables for recipient lookup
+        # System dynamic variables for recipient lookup, then the
+        # template's own parameters
         tool_parameters = [
-            {
-                "name": "conversation_id",
-                "type": "string",
-                "description": "Conversation ID",
-                "required": True,
-                "dynamic_variable": "system__conversation_id"
-            },
-            {
-                "name": "agent_id",
-                "type": "string",
-                "description": "Agent ID",
-                "required": True,
-                "dynamic_variable": "system__agent_id"
-            },
-            {
-                "name": "called_number",
-                "type": "string",
-                "description": "Recipient phone number",
-                "required": True,
-                "dynamic_variable": "system__called_number"
-            }
+            *_SYSTEM_PARAMS,
+            *(
+                {
+                    "name": param.name,
+                    "type": "string",
+                    "description": param.description,
+                    "required": param.required
+                }
+                for param in template.parameters
+            )
         ]
-        
-        # Add template parameters
-        for param in template.parameters:
-            tool_parameters.append({
-                "name": param.name,
-                "type": "string",
-                "description": param.description,
-                "required": param.required
-            })
-        
+
         # Create the webhook tool
         result = self.tools_service.create_webhook_tool(
             name=template.template_id,
@@ -266,9 +527,28 @@ class EmailTemplateService:
         
         return result.get("tool_id", result.get("id"))
     
+    def _evict_over_cap(self) -> None:
+        """Evict least recently used templates past max_templates."""
+        while len(self._templates) > self._max_templates:
+            evicted_id, evicted = self._templates.popitem(last=False)
+            if evicted.tool_id:
+                # Local bookkeeping only: the server-side tool may still
+                # be wired into live agents, so it is removed solely by
+                # an explicit delete_template
+                self._templates_by_tool.pop(evicted.tool_id, None)
+            self.logger.warning(f"Template store full, evicted {evicted_id}")
+
     def get_template(self, template_id: str) -> Optional[EmailTemplate]:
         """Get a template by ID."""
-        return self._templates.get(template_id)
+        template = self._templates.get(template_id)
+        if template is not None:
+            # Recently used templates survive eviction
+            self._templates.move_to_end(template_id)
+        return template
+
+    def get_template_by_tool_id(self, tool_id: str) -> Optional[EmailTemplate]:
+        """Get a template by its ElevenLabs tool ID."""
+        return self._templates_by_tool.get(tool_id)
     
     def list_templates(self) -> List[EmailTemplate]:
         """List all templates."""
@@ -276,20 +556,21 @@ class EmailTemplateService:
     
     def delete_template(self, template_id: str) -> bool:
         """Delete a template."""
-        if template_id in self._templates:
-            template = self._templates[template_id]
-            
+        template = self._templates.pop(template_id, None)
+        if template is None:
+            return False
+
+        if template.tool_id:
             # Try to delete the associated tool (may fail if in use)
-            if template.tool_id:
-                try:
-                    self.tools_service.delete_tool(template.tool_id)
-                except Exception as e:
-                    self.logger.warning(f"Could not delete tool {template.tool_id}: {e}")
-            
-            del self._templates[template_id]
-            self.logger.info(f"Deleted email template: {template_id}")
-            return True
-        return False
+            try:
+                self.tools_service.delete_tool(template.tool_id)
+            except Exception as e:
+                self.logger.warning(f"Could not delete tool {template.tool_id}: {e}")
+            self._templates_by_tool.pop(template.tool_id, None)
+
+        self._render_cache.clear()
+        self.logger.info(f"Deleted email template: {template_id}")
+        return True
     
     def send_email(
         self,
@@ -312,86 +593,262 @@ class EmailTemplateService:
         Returns:
             API response
         """
+        payload, headers, to_email = self._prepare_send(
+            template_id, customer_info, parameters, user_email
+        )
+
+        response = _get_sync_session().post(
+            email_api_url, data=_dumps(payload), headers=headers, timeout=30
+        )
+
+        if response.ok:
+            self.logger.info(f"Email sent successfully to {to_email}")
+            return {"success": True, "message": f"Email sent to {to_email}"}
+        else:
+            self.logger.error(f"Failed to send email: {response.status_code} - {response.text}")
+            return {"success": False, "error": response.text}
+
+    def send_bulk(
+        self,
+        template_id: str,
+        recipients: List[Tuple[Dict[str, Any], Dict[str, Any]]],
+        email_api_url: str = "https://keplerov1-python-2.onrender.com/email/send",
+        user_email: str = "amarc8399@gmail.com",
+        max_workers: int = 16
+    ) -> List[Dict[str, Any]]:
+        """
+        Send one templated email per recipient in parallel.
+
+        Sends are network-bound, so fanning them out over a thread pool
+        (sharing the pooled session) replaces serial 30s-timeout POSTs
+        with concurrent ones.
+
+        Args:
+            template_id: Template to use for every recipient
+            recipients: List of (customer_info, parameters) tuples
+            email_api_url: External email API URL
+            user_email: x-user-email header value
+            max_workers: Thread pool size
+
+        Returns:
+            Per-recipient result dicts, in input order
+        """
+        def _send_one(pair: Tuple[Dict[str, Any], Dict[str, Any]]) -> Dict[str, Any]:
+            customer_info, parameters = pair
+            try:
+                return self.send_email(
+                    template_id, customer_info, parameters,
+                    email_api_url=email_api_url, user_email=user_email
+                )
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_send_one, recipients))
+
+    async def send_email_async(
+        self,
+        template_id: str,
+        customer_info: Dict[str, Any],
+        parameters: Dict[str, Any],
+        email_api_url: str = "https://keplerov1-python-2.onrender.com/email/send",
+        user_email: str = "amarc8399@gmail.com"
+    ) -> Dict[str, Any]:
+        """
+        Send email using a template without blocking the event loop.
+
+        Same contract as send_email, but posts through a shared
+        httpx.AsyncClient so connections are kept alive between sends.
+        Prefer this from async webhook handlers.
+        """
+        payload, headers, to_email = self._prepare_send(
+            template_id, customer_info, parameters, user_email
+        )
+
+        client = _get_async_client()
+        response = await client.post(
+            email_api_url, content=_dumps(payload), headers=headers
+        )
+
+        if response.is_success:
+            self.logger.info(f"Email sent successfully to {to_email}")
+            return {"success": True, "message": f"Email sent to {to_email}"}
+        else:
+            self.logger.error(f"Failed to send email: {response.status_code} - {response.text}")
+            return {"success": False, "error": response.text}
+
+    # Batching knobs: flush when this many emails are queued, or after the
+    # grace period elapses, whichever comes first
+    _BATCH_MAX = 64
+    _BATCH_WAIT = 0.05  # seconds
+
+    async def queue_email(
+        self,
+        template_id: str,
+        customer_info: Dict[str, Any],
+        parameters: Dict[str, Any],
+        email_api_url: str = "https://keplerov1-python-2.onrender.com/email/send_batch",
+        user_email: str = "amarc8399@gmail.com"
+    ) -> Dict[str, Any]:
+        """
+        Queue an email for batched delivery.
+
+        Fan-out sends (e.g. appointment reminders to many recipients) are
+        collected by a background flusher and delivered with a single POST
+        of a JSON array, so one round-trip replaces one per recipient.
+
+        Note:
+            Requires the external API's batch endpoint (/email/send_batch).
+            Use send_email/send_email_async for single immediate sends.
+        """
+        payload, headers, to_email = self._prepare_send(
+            template_id, customer_info, parameters, user_email
+        )
+
+        self._ensure_flusher()
+        await self._batch_queue.put((email_api_url, headers, payload))
+        return {"success": True, "queued": True, "message": f"Email queued for {to_email}"}
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flush task on the running loop if needed."""
+        if self._batch_queue is None:
+            self._batch_queue = asyncio.Queue()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_batches())
+
+    async def _flush_batches(self) -> None:
+        """Drain queued emails and post them in batches."""
+        while True:
+            items = [await self._batch_queue.get()]
+            # Grace period lets concurrent callers join the same batch
+            await asyncio.sleep(self._BATCH_WAIT)
+            while len(items) < self._BATCH_MAX and not self._batch_queue.empty():
+                items.append(self._batch_queue.get_nowait())
+
+            # One POST per (endpoint, sender) group
+            groups: Dict[tuple, tuple] = {}
+            for url, headers, payload in items:
+                key = (url, headers.get("x-user-email"))
+                groups.setdefault(key, (headers, []))[1].append(payload)
+
+            client = _get_async_client()
+            for (url, _), (headers, payloads) in groups.items():
+                try:
+                    response = await client.post(url, json=payloads, headers=headers)
+                    if response.is_success:
+                        self.logger.info("Batch of %d emails sent", len(payloads))
+                    else:
+                        self.logger.error(
+                            "Batch send failed: %s - %s", response.status_code, response.text
+                        )
+                except Exception as e:
+                    self.logger.error("Batch send error: %s", e)
+
+    def _prepare_send(
+        self,
+        template_id: str,
+        customer_info: Dict[str, Any],
+        parameters: Dict[str, Any],
+        user_email: str
+    ) -> tuple:
+        """Render the template and build the (payload, headers, to_email) triple."""
         template = self.get_template(template_id)
         if not template:
             raise ValueError(f"Template not found: {template_id}")
-        
+
         # Merge customer info, dynamic_variables (from call/batch), and tool parameters
         # Order: base fields < dynamic_variables < parameters (parameters override)
         dynamic_vars = customer_info.get("dynamic_variables") or {}
+        # Session-sourced dicts are canonicalized at store() time; ad-hoc
+        # callers still get the alias fallback chain
+        cname = customer_info.get("customer_name")
+        cemail = customer_info.get("customer_email")
+        if cname is None or cemail is None:
+            cname = customer_info.get("name", customer_info.get("customer_name", ""))
+            cemail = customer_info.get("email", customer_info.get("customer_email", ""))
         all_values = {
-            "customer_name": customer_info.get("name", customer_info.get("customer_name", "")),
-            "customer_email": customer_info.get("email", customer_info.get("customer_email", "")),
-            "name": customer_info.get("name", customer_info.get("customer_name", "")),
-            "email": customer_info.get("email", customer_info.get("customer_email", "")),
+            "customer_name": cname,
+            "customer_email": cemail,
+            "name": cname,
+            "email": cemail,
             **dynamic_vars,
             **parameters,
         }
-        
+
         # Fill templates
-        subject = self._fill_template(template.subject_template, all_values)
-        body = self._fill_template(template.body_template, all_values)
-        
+        subject, body = self._render(template, all_values)
+
         # Get recipient email
-        to_email = customer_info.get("email", customer_info.get("customer_email"))
+        to_email = cemail
         if not to_email:
             raise ValueError("Customer email not found in customer_info")
-        
+
         # Send via external API
         payload = {
             "to": to_email,
             "subject": subject,
             "body": body
         }
-        
-        headers = {
-            "accept": "application/json",
-            "Content-Type": "application/json",
-            "x-user-email": user_email
-        }
-        
+
+        headers = _send_headers(user_email)
+
         self.logger.info(f"Sending email to {to_email} using template {template_id}")
         self.logger.debug(f"Subject: {subject}")
-        
-        response = requests.post(email_api_url, json=payload, headers=headers, timeout=30)
-        
-        if response.ok:
-            self.logger.info(f"Email sent successfully to {to_email}")
-            return {"success": True, "message": f"Email sent to {to_email}"}
-        else:
-            self.logger.error(f"Failed to send email: {response.status_code} - {response.text}")
-            return {"success": False, "error": response.text}
+
+        return payload, headers, to_email
 
 
 # Global instances
 customer_sessions = CustomerSessionStore()
 _email_template_service: Optional[EmailTemplateService] = None
-_templates_loaded = False
 
+# Serializes singleton creation; template loading hits the ElevenLabs
+# tool-creation API, so a startup race would duplicate expensive calls
+_init_lock = threading.Lock()
+
+_eleven_config: Optional[ElevenLabsConfig] = None
+
+
+def _cfg() -> ElevenLabsConfig:
+    """Get the shared ElevenLabsConfig, constructing it once."""
+    global _eleven_config
+    if _eleven_config is None:
+        _eleven_config = ElevenLabsConfig()
+    return _eleven_config
 
-def load_templates_from_config(service: EmailTemplateService) -> int:
+
+def load_templates_from_config(
+    service: EmailTemplateService,
+    config_data: Optional[Dict[str, Any]] = None
+) -> int:
     """
     Load templates from the config file.
-    
+
     If a template has a tool_id, it will use that existing tool.
     If no tool_id, it will create a new tool in ElevenLabs.
-    
+
+    Args:
+        service: Service to load templates into
+        config_data: Already-parsed config dict; when None the file is read
+
     Returns:
         Number of templates loaded
     """
-    if not CONFIG_FILE_PATH.exists():
+    if config_data is None and not CONFIG_FILE_PATH.exists():
         logger.info(f"No config file found at {CONFIG_FILE_PATH}")
         return 0
-    
+
     try:
-        with open(CONFIG_FILE_PATH, 'r') as f:
-            config_data = json.load(f)
-        
+        if config_data is None:
+            config_data = _read_config_file()
+
         templates = config_data.get("templates", [])
         loaded_count = 0
         
         for template_config in templates:
-            template_id = template_config["name"].lower().replace(" ", "_").replace("-", "_")
+            template_id = sys.intern(
+                template_config["name"].lower().replace(" ", "_").replace("-", "_")
+            )
             
             # Skip if already loaded
             if service.get_template(template_id):
@@ -422,6 +879,7 @@ def load_templates_from_config(service: EmailTemplateService) -> int:
                 )
                 
                 service._templates[template_id] = template
+                service._templates_by_tool[existing_tool_id] = template
                 loaded_count += 1
             else:
                 # Create new template with new tool
@@ -445,49 +903,51 @@ def load_templates_from_config(service: EmailTemplateService) -> int:
         return 0
 
 
+def _ensure_templates_loaded(
+    service: EmailTemplateService,
+    config_data: Optional[Dict[str, Any]] = None
+) -> None:
+    """Load templates from config once per service instance."""
+    if not service._templates_loaded:
+        load_templates_from_config(service, config_data)
+        service._templates_loaded = True
+
+
 def get_email_template_service(webhook_base_url: str = None) -> EmailTemplateService:
     """Get or create the email template service singleton."""
-    global _email_template_service, _templates_loaded
-    
-    from config import ElevenLabsConfig
-    config = ElevenLabsConfig()
-    
-    # If webhook_base_url is provided, always create/update the service with it
-    if webhook_base_url:
-        _email_template_service = EmailTemplateService(config, webhook_base_url)
-        # Load templates from config
-        if not _templates_loaded:
-            load_templates_from_config(_email_template_service)
-            _templates_loaded = True
-    elif _email_template_service is None:
-        # Try to get webhook_base_url from config file
-        default_url = "http://localhost:8000/api/v1"
-        if CONFIG_FILE_PATH.exists():
-            try:
-                with open(CONFIG_FILE_PATH, 'r') as f:
-                    config_data = json.load(f)
+    global _email_template_service
+
+    config = _cfg()
+
+    with _init_lock:
+        # If webhook_base_url is provided, always create/update the service with it
+        if webhook_base_url:
+            _email_template_service = EmailTemplateService(config, webhook_base_url)
+            _ensure_templates_loaded(_email_template_service)
+        elif _email_template_service is None:
+            # Try to get webhook_base_url from config file; keep the parsed
+            # dict so template loading doesn't re-read the file
+            default_url = "http://localhost:8000/api/v1"
+            config_data = None
+            if CONFIG_FILE_PATH.exists():
+                try:
+                    config_data = _read_config_file()
                     default_url = config_data.get("webhook_base_url", default_url)
-            except Exception:
-                pass
-        
-        _email_template_service = EmailTemplateService(config, default_url)
-        # Load templates from config
-        if not _templates_loaded:
-            load_templates_from_config(_email_template_service)
-            _templates_loaded = True
-    
-    return _email_template_service
+                except Exception:
+                    config_data = None
+
+            _email_template_service = EmailTemplateService(config, default_url)
+            _ensure_templates_loaded(_email_template_service, config_data)
+
+        return _email_template_service
 
 
 def set_webhook_base_url(webhook_base_url: str) -> None:
     """Set the webhook base URL for the service."""
-    global _email_template_service, _templates_loaded
-    
-    from config import ElevenLabsConfig
-    config = ElevenLabsConfig()
-    _email_template_service = EmailTemplateService(config, webhook_base_url)
-    
-    # Load templates from config
-    if not _templates_loaded:
-        load_templates_from_config(_email_template_service)
-        _templates_loaded = True
+    global _email_template_service
+
+    config = _cfg()
+
+    with _init_lock:
+        _email_template_service = EmailTemplateService(config, webhook_base_url)
+        _ensure_templates_loaded(_email_template_service)
@@ -3,10 +3,17 @@ Custom exceptions for ElevenLabs API Client.
 Provides specific exception types for different error scenarios.
 """
 
+import random
+import sys
+import time
+from functools import wraps
+
 
 class ElevenLabsError(Exception):
     """Base exception for all ElevenLabs API errors."""
-    
+
+    __slots__ = ("message", "status_code", "response")
+
     def __init__(self, message: str, status_code: int = None, response: dict = None):
         """
         Initialize ElevenLabs error.
@@ -29,12 +36,14 @@ class ElevenLabsError(Exception):
 
 class AuthenticationError(ElevenLabsError):
     """Raised when API authentication fails."""
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(ElevenLabsError):
     """Raised when API rate limit is exceeded."""
-    
+
+    __slots__ = ("retry_after",)
+
     def __init__(self, message: str, retry_after: int = None, **kwargs):
         """
         Initialize rate limit error.
@@ -50,120 +59,150 @@ class RateLimitError(ElevenLabsError):
 
 class NotFoundError(ElevenLabsError):
     """Raised when a requested resource is not found."""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(ElevenLabsError):
     """Raised when request validation fails."""
-    pass
+    __slots__ = ()
 
 
 class ServerError(ElevenLabsError):
     """Raised when the server returns an error."""
-    pass
+    __slots__ = ()
 
 
 class ConnectionError(ElevenLabsError):
     """Raised when connection to API fails."""
-    pass
+    __slots__ = ()
 
 
 class TimeoutError(ElevenLabsError):
     """Raised when API request times out."""
-    pass
+    __slots__ = ()
 
 
 class AgentError(ElevenLabsError):
     """Raised for agent-specific errors."""
-    pass
+    __slots__ = ()
 
 
 class SIPTrunkError(ElevenLabsError):
     """Raised for SIP trunk related errors."""
-    pass
+    __slots__ = ()
 
 
 class BatchCallError(ElevenLabsError):
     """Raised for batch calling errors."""
-    pass
+    __slots__ = ()
+
+
+# Status-code dispatch table built once at import; hot retry loops (429s)
+# hit a single dict lookup instead of walking an elif ladder
+# Default messages are interned: the common bodyless-error case reuses
+# one canonical string object per status instead of allocating anew
+_STATUS_MAP = {
+    401: (AuthenticationError, sys.intern("Invalid API key or unauthorized access")),
+    403: (AuthenticationError, sys.intern("Access forbidden")),
+    404: (NotFoundError, sys.intern("Resource not found")),
+    422: (ValidationError, sys.intern("Validation error")),
+    429: (RateLimitError, sys.intern("Rate limit exceeded")),
+}
+
+
+def _extract_message(response) -> str:
+    """Extract a human-readable message from an API error response."""
+    if not response:
+        return "Unknown error"
+    if isinstance(response, dict):
+        # Try to extract message from various possible response structures
+        detail = response.get("detail", {})
+        if isinstance(detail, dict):
+            return detail.get("message", response.get("message",
+                   response.get("error", str(response))))
+        # detail is a string
+        return str(detail)
+    # response is a string or other type
+    return str(response)
 
 
 def raise_for_status(status_code: int, response = None):
     """
     Raise appropriate exception based on HTTP status code.
-    
+
     Args:
         status_code: HTTP status code
         response: API response body (dict or string)
-        
+
     Raises:
         Appropriate ElevenLabsError subclass
     """
-    message = "Unknown error"
-    
-    if response:
-        if isinstance(response, dict):
-            # Try to extract message from various possible response structures
-            detail = response.get("detail", {})
-            if isinstance(detail, dict):
-                message = detail.get("message", response.get("message", 
-                          response.get("error", str(response))))
-            else:
-                # detail is a string
-                message = str(detail)
-        else:
-            # response is a string or other type
-            message = str(response)
-    
-    if status_code == 401:
-        raise AuthenticationError(
-            message=message or "Invalid API key or unauthorized access",
-            status_code=status_code,
-            response=response
-        )
-    
-    elif status_code == 403:
-        raise AuthenticationError(
-            message=message or "Access forbidden",
-            status_code=status_code,
-            response=response
-        )
-    
-    elif status_code == 404:
-        raise NotFoundError(
-            message=message or "Resource not found",
-            status_code=status_code,
-            response=response
-        )
-    
-    elif status_code == 422:
-        raise ValidationError(
-            message=message or "Validation error",
+    mapped = _STATUS_MAP.get(status_code)
+
+    if mapped is not None:
+        exc_class, default_message = mapped
+        # Bodyless errors (the common case) skip message extraction
+        # entirely and reuse the interned default
+        message = _extract_message(response) if response else default_message
+
+        if exc_class is RateLimitError:
+            retry_after = None
+            if isinstance(response, dict):
+                retry_after = response.get("retry_after")
+            raise RateLimitError(
+                message=message,
+                status_code=status_code,
+                response=response,
+                retry_after=retry_after
+            )
+
+        raise exc_class(
+            message=message,
             status_code=status_code,
             response=response
         )
-    
-    elif status_code == 429:
-        retry_after = None
-        if response and isinstance(response, dict):
-            retry_after = response.get("retry_after")
-        raise RateLimitError(
-            message=message or "Rate limit exceeded",
-            status_code=status_code,
-            response=response,
-            retry_after=retry_after
-        )
-    
-    elif 500 <= status_code < 600:
+
+    if 500 <= status_code < 600:
         raise ServerError(
-            message=message or "Server error",
+            message=_extract_message(response) or "Server error",
             status_code=status_code,
             response=response
         )
-    
-    elif status_code >= 400:
+
+    if status_code >= 400:
         raise ElevenLabsError(
-            message=message,
+            message=_extract_message(response),
             status_code=status_code,
             response=response
         )
+
+
+def retry_with_backoff(max_retries: int = 5, base: float = 0.5,
+                       cap: float = 32.0, jitter: float = 0.2):
+    """
+    Decorator that retries a call when the API rate-limits it.
+
+    Prefers the server-supplied retry_after; otherwise sleeps an
+    exponentially growing delay capped at `cap`. A small random jitter
+    is always added so many clients backing off together don't retry
+    in lockstep.
+
+    Args:
+        max_retries: Attempts before the RateLimitError propagates
+        base: First exponential delay in seconds
+        cap: Upper bound on the exponential delay
+        jitter: Maximum random extra sleep in seconds
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(max_retries):
+                try:
+                    return func(*args, **kwargs)
+                except RateLimitError as e:
+                    if attempt == max_retries - 1:
+                        raise
+                    delay = e.retry_after or min(base * (2 ** attempt), cap)
+                    time.sleep(delay + random.random() * jitter)
+        return wrapper
+    return decorator
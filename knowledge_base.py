@@ -3,11 +3,37 @@ Knowledge Base Service for ElevenLabs API.
 Handles document ingestion from text, URL, or file.
 """
 
-from typing import Optional, Dict, Any
+import os
+import mimetypes
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterator, Union, IO
 
 from base import BaseClient
 from config import ElevenLabsConfig
-from logger import APICallLogger
+
+try:
+    import orjson  # C JSON parser; optional fast path for upload responses
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+try:
+    # Streams multipart bodies chunk-by-chunk instead of assembling them
+    # in memory; optional, large uploads fall back to buffering without it
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+# Load the MIME database once at import instead of on the first upload
+mimetypes.init()
+
+
+@lru_cache(maxsize=128)
+def _content_type_for(ext: str) -> str:
+    """Content type for a lowercased file extension."""
+    return mimetypes.types_map.get(ext) or "application/octet-stream"
 
 
 class KnowledgeBaseService(BaseClient):
@@ -44,6 +70,10 @@ class KnowledgeBaseService(BaseClient):
             config: ElevenLabsConfig instance
         """
         super().__init__(config, logger_name="elevenlabs.knowledge_base")
+        # Precomputed per-document prefix and full upload URL; per-call
+        # paths become a single concatenation instead of an f-string build
+        self._kb_base = self.KB_BASE_ENDPOINT + "/"
+        self._kb_file_url = config.base_url + self.KB_FILE_ENDPOINT
         self.logger.info("KnowledgeBaseService initialized")
     
     def create_from_text(
@@ -75,14 +105,13 @@ class KnowledgeBaseService(BaseClient):
             ... )
             >>> print(doc["document_id"])
         """
-        with APICallLogger(self.logger, "Create KB Document from Text"):
-            payload = {"text": text}
-            
-            if name:
-                payload["name"] = name
-            if parent_folder_id:
-                payload["parent_folder_id"] = parent_folder_id
-            
+        with self._apilog("Create KB Document from Text"):
+            payload = {
+                "text": text,
+                **({"name": name} if name else {}),
+                **({"parent_folder_id": parent_folder_id} if parent_folder_id else {})
+            }
+
             response = self._make_request(
                 method="POST",
                 endpoint=self.KB_TEXT_ENDPOINT,
@@ -121,14 +150,13 @@ class KnowledgeBaseService(BaseClient):
             ...     name="FAQ Page"
             ... )
         """
-        with APICallLogger(self.logger, "Create KB Document from URL", url=url):
-            payload = {"url": url}
-            
-            if name:
-                payload["name"] = name
-            if parent_folder_id:
-                payload["parent_folder_id"] = parent_folder_id
-            
+        with self._apilog("Create KB Document from URL", url=url):
+            payload = {
+                "url": url,
+                **({"name": name} if name else {}),
+                **({"parent_folder_id": parent_folder_id} if parent_folder_id else {})
+            }
+
             response = self._make_request(
                 method="POST",
                 endpoint=self.KB_URL_ENDPOINT,
@@ -141,18 +169,20 @@ class KnowledgeBaseService(BaseClient):
     
     def create_from_file(
         self,
-        file_content: bytes,
+        file_content: Union[bytes, IO[bytes]],
         filename: str,
         name: Optional[str] = None,
         parent_folder_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Create a knowledge base document from a file upload.
-        
+
         API Endpoint: POST /v1/convai/knowledge-base/file
-        
+
         Args:
-            file_content: The file content as bytes
+            file_content: The file content as bytes or an open binary file.
+                Passing the file object streams the upload (with
+                requests_toolbelt installed) instead of buffering it
             filename: Original filename (used for content-type detection)
             name: Optional custom name for the document
             parent_folder_id: Optional folder ID to place document in
@@ -172,54 +202,69 @@ class KnowledgeBaseService(BaseClient):
         Example:
             >>> with open("manual.pdf", "rb") as f:
             ...     doc = service.create_from_file(
-            ...         file_content=f.read(),
+            ...         file_content=f,
             ...         filename="manual.pdf",
             ...         name="Product Manual"
             ...     )
         """
-        with APICallLogger(self.logger, "Create KB Document from File", filename=filename):
-            url = f"{self.config.base_url}{self.KB_FILE_ENDPOINT}"
-            
+        with self._apilog("Create KB Document from File", filename=filename):
+            url = self._kb_file_url
+
             # Determine content type based on file extension
-            import mimetypes
-            content_type, _ = mimetypes.guess_type(filename)
-            if not content_type:
-                content_type = "application/octet-stream"
-            
-            # Prepare multipart form data with explicit content type
-            files = {
-                "file": (filename, file_content, content_type)
-            }
-            
+            ext = os.path.splitext(filename)[1].lower()
+            content_type = _content_type_for(ext)
+
             data = {}
             if name:
                 data["name"] = name
             if parent_folder_id:
                 data["parent_folder_id"] = parent_folder_id
-            
+
             # Use custom headers without Content-Type (let requests set it for multipart)
             headers = {
                 "xi-api-key": self.config.api_key,
                 "Accept": "application/json"
             }
-            
-            response = self.session.post(
-                url,
-                files=files,
-                data=data if data else None,
-                headers=headers,
-                timeout=self.config.timeout
-            )
-            
+
+            # Direct session post, so pre-gate against the shared bucket
+            # the same way _make_request does
+            self._rate_limiter.acquire()
+
+            if MultipartEncoder is not None:
+                # Stream the body in chunks; never holds caller bytes plus
+                # an assembled multipart copy in memory at once
+                encoder = MultipartEncoder(
+                    fields={"file": (filename, file_content, content_type), **data}
+                )
+                headers["Content-Type"] = encoder.content_type
+                response = self.session.post(
+                    url,
+                    data=encoder,
+                    headers=headers,
+                    timeout=self.config.timeout
+                )
+            else:
+                # Prepare multipart form data with explicit content type
+                files = {
+                    "file": (filename, file_content, content_type)
+                }
+                response = self.session.post(
+                    url,
+                    files=files,
+                    data=data if data else None,
+                    headers=headers,
+                    timeout=self.config.timeout
+                )
+
             if not response.ok:
                 from exceptions import raise_for_status
                 try:
-                    response_data = response.json()
+                    response_data = _loads(response.content)
                 except ValueError:
                     response_data = {"error": response.text}
                 raise_for_status(response.status_code, response_data)
-            
-            result = response.json()
+
+            result = _loads(response.content)
             doc_id = result.get("document_id", "unknown")
             self.logger.info(f"KB document created from file: {doc_id}")
             return result
@@ -234,10 +279,10 @@ class KnowledgeBaseService(BaseClient):
         Returns:
             Document details
         """
-        with APICallLogger(self.logger, "Get KB Document", document_id=document_id):
+        with self._apilog("Get KB Document", document_id=document_id):
             response = self._make_request(
                 method="GET",
-                endpoint=f"{self.KB_BASE_ENDPOINT}/{document_id}"
+                endpoint=self._kb_base + document_id
             )
             
             self.logger.info(f"Retrieved KB document: {document_id}")
@@ -258,7 +303,7 @@ class KnowledgeBaseService(BaseClient):
         Returns:
             List of documents with pagination
         """
-        with APICallLogger(self.logger, "List KB Documents"):
+        with self._apilog("List KB Documents"):
             params = {"page_size": page_size}
             if cursor:
                 params["cursor"] = cursor
@@ -273,6 +318,33 @@ class KnowledgeBaseService(BaseClient):
             self.logger.info(f"Retrieved {count} KB documents")
             return response
     
+    def iter_documents(self, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every knowledge base document across all pages.
+
+        Prefetches the next page on a background thread while the caller
+        consumes the current one, overlapping the network round-trip
+        with per-document processing.
+
+        Args:
+            page_size: Results requested per page
+
+        Yields:
+            Individual document dictionaries
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.list_documents, page_size=page_size)
+            while future is not None:
+                response = future.result()
+                cursor = response.get("next_cursor")
+                future = (
+                    executor.submit(
+                        self.list_documents, cursor=cursor, page_size=page_size
+                    )
+                    if cursor else None
+                )
+                yield from response.get("documents", [])
+
     def delete_document(self, document_id: str, force: bool = True) -> Dict[str, Any]:
         """
         Delete a knowledge base document.
@@ -284,11 +356,11 @@ class KnowledgeBaseService(BaseClient):
         Returns:
             Deletion confirmation
         """
-        with APICallLogger(self.logger, "Delete KB Document", document_id=document_id):
+        with self._apilog("Delete KB Document", document_id=document_id):
             params = {"force": "true"} if force else None
             response = self._make_request(
                 method="DELETE",
-                endpoint=f"{self.KB_BASE_ENDPOINT}/{document_id}",
+                endpoint=self._kb_base + document_id,
                 params=params
             )
             
@@ -4,10 +4,12 @@ Provides structured logging with customizable formatters and handlers.
 """
 
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional
 from functools import wraps
-from time import time
+from time import monotonic_ns
 
 
 def setup_logger(
@@ -48,14 +50,28 @@ def setup_logger(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler (optional)
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # The hot path only enqueues records; formatting and stdout/disk
+    # writes happen on the listener's background thread so API calls
+    # never block on I/O
+    log_queue: "queue.Queue" = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    # Keep a reference so the listener isn't collected and can be
+    # stopped explicitly if needed
+    logger._queue_listener = listener
     
     # Prevent propagation to root logger
     logger.propagate = False
@@ -79,30 +95,34 @@ def log_api_call(logger: logging.Logger):
             # Extract method name and relevant info
             method_name = func.__name__
             
-            # Log request start
+            # Log request start; args slicing and repr are skipped
+            # entirely unless DEBUG is actually on
             logger.info(f"API Call Started: {method_name}")
-            logger.debug(f"Arguments: args={args[1:]}, kwargs={kwargs}")
-            
-            start_time = time()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Arguments: args=%s, kwargs=%s", args[1:], kwargs)
             
+            # Monotonic integer clock: immune to NTP adjustments, no FP math
+            start_time = monotonic_ns()
+
             try:
                 result = func(*args, **kwargs)
-                
+
                 # Calculate duration
-                duration = time() - start_time
-                
+                duration_ms = (monotonic_ns() - start_time) // 1_000_000
+
                 # Log success
-                logger.info(f"API Call Completed: {method_name} (Duration: {duration:.3f}s)")
-                logger.debug(f"Response: {result}")
-                
+                logger.info(f"API Call Completed: {method_name} (Duration: {duration_ms}ms)")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response: %s", result)
+
                 return result
-                
+
             except Exception as e:
                 # Calculate duration
-                duration = time() - start_time
-                
+                duration_ms = (monotonic_ns() - start_time) // 1_000_000
+
                 # Log failure
-                logger.error(f"API Call Failed: {method_name} (Duration: {duration:.3f}s) - Error: {str(e)}")
+                logger.error(f"API Call Failed: {method_name} (Duration: {duration_ms}ms) - Error: {str(e)}")
                 raise
                 
         return wrapper
@@ -111,7 +131,11 @@ def log_api_call(logger: logging.Logger):
 
 class APICallLogger:
     """Context manager for logging API calls."""
-    
+
+    # Every request allocates one of these; slots skip the per-instance
+    # __dict__ and make attribute access a fixed-offset load
+    __slots__ = ("logger", "operation", "context", "start_time", "_enabled")
+
     def __init__(self, logger: logging.Logger, operation: str, **context):
         """
         Initialize API call logger.
@@ -125,26 +149,57 @@ class APICallLogger:
         self.operation = operation
         self.context = context
         self.start_time = None
-    
+        # Checked once here so a disabled logger makes the whole context
+        # manager a near no-op on the hot API path
+        self._enabled = logger.isEnabledFor(logging.INFO)
+
+    def __call__(self, operation: str, **context):
+        """
+        Re-arm this instance for another operation.
+
+        Services keep one APICallLogger and re-arm it per call, so the
+        hot path skips the per-call object allocation:
+
+            with self._apilog("Get KB Document", document_id=doc_id):
+                ...
+
+        Not safe for concurrent calls on the same service instance.
+        """
+        self.operation = operation
+        self.context = context
+        self.start_time = None
+        self._enabled = self.logger.isEnabledFor(logging.INFO)
+        return self
+
     def __enter__(self):
         """Log operation start."""
-        self.start_time = time()
-        self.logger.info(f"Starting: {self.operation}")
-        if self.context:
-            self.logger.debug(f"Context: {self.context}")
+        if self._enabled:
+            self.start_time = monotonic_ns()
+            self.logger.info("Starting: %s", self.operation)
+            if self.context and self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Context: %s", self.context)
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Log operation end."""
-        duration = time() - self.start_time
-        
+        if not self._enabled:
+            # Failures are still worth surfacing even when INFO is off
+            if exc_type is not None:
+                self.logger.error(
+                    "Failed: %s - Error: %s: %s",
+                    self.operation, exc_type.__name__, exc_val
+                )
+            return False
+
+        duration_ms = (monotonic_ns() - self.start_time) // 1_000_000
+
         if exc_type is None:
-            self.logger.info(f"Completed: {self.operation} (Duration: {duration:.3f}s)")
+            self.logger.info(f"Completed: {self.operation} (Duration: {duration_ms}ms)")
         else:
             self.logger.error(
-                f"Failed: {self.operation} (Duration: {duration:.3f}s) - "
+                f"Failed: {self.operation} (Duration: {duration_ms}ms) - "
                 f"Error: {exc_type.__name__}: {exc_val}"
             )
-        
+
         # Don't suppress exceptions
         return False
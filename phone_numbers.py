@@ -3,11 +3,11 @@ Phone Number Service for ElevenLabs API.
 Handles phone number import and management operations.
 """
 
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterator
 
 from base import BaseClient
 from config import ElevenLabsConfig
-from logger import APICallLogger
 
 
 class PhoneNumberService(BaseClient):
@@ -44,6 +44,9 @@ class PhoneNumberService(BaseClient):
             config: ElevenLabsConfig instance
         """
         super().__init__(config, logger_name="elevenlabs.phone_numbers")
+        # Fixed prefix for per-number endpoints; per-call paths become a
+        # single concatenation instead of an f-string build
+        self._phone_base = self.PHONE_NUMBERS_ENDPOINT + "/"
         self.logger.info("PhoneNumberService initialized")
     
     def import_phone_number(
@@ -78,16 +81,16 @@ class PhoneNumberService(BaseClient):
             ... )
             >>> print(result["phone_number_id"])
         """
-        with APICallLogger(self.logger, "Import Phone Number", phone_number=phone_number):
+        with self._apilog("Import Phone Number", phone_number=phone_number):
+            # One-shot construction; no post-hoc inserts or resizes
             payload = {
                 "phone_number": phone_number,
                 "label": label,
                 "sid": sid,
-                "token": token
+                "token": token,
+                **kwargs
             }
-            
-            payload.update(kwargs)
-            
+
             response = self._make_request(
                 method="POST",
                 endpoint=self.PHONE_NUMBERS_ENDPOINT,
@@ -137,8 +140,8 @@ class PhoneNumberService(BaseClient):
             ... })
             >>> print(result["phone_number_id"])
         """
-        with APICallLogger(self.logger, "Import SIP Trunk Phone Number", 
-                          phone_number=payload.get("phone_number")):
+        with self._apilog("Import SIP Trunk Phone Number",
+                           phone_number=payload.get("phone_number")):
             response = self._make_request(
                 method="POST",
                 endpoint=self.PHONE_NUMBERS_ENDPOINT,
@@ -164,10 +167,10 @@ class PhoneNumberService(BaseClient):
         Raises:
             NotFoundError: If phone number doesn't exist
         """
-        with APICallLogger(self.logger, "Get Phone Number", phone_number_id=phone_number_id):
+        with self._apilog("Get Phone Number", phone_number_id=phone_number_id):
             response = self._make_request(
                 method="GET",
-                endpoint=f"{self.PHONE_NUMBERS_ENDPOINT}/{phone_number_id}"
+                endpoint=self._phone_base + phone_number_id
             )
             
             self.logger.info(f"Retrieved phone number: {phone_number_id}")
@@ -190,7 +193,7 @@ class PhoneNumberService(BaseClient):
         Returns:
             List of phone numbers with pagination
         """
-        with APICallLogger(self.logger, "List Phone Numbers"):
+        with self._apilog("List Phone Numbers"):
             params = {"page_size": page_size}
             if cursor:
                 params["cursor"] = cursor
@@ -205,6 +208,33 @@ class PhoneNumberService(BaseClient):
             self.logger.info(f"Retrieved {count} phone numbers")
             return response
     
+    def iter_phone_numbers(self, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every imported phone number across all pages.
+
+        Prefetches the next page on a background thread while the caller
+        consumes the current one, overlapping the network round-trip
+        with per-number processing.
+
+        Args:
+            page_size: Results requested per page
+
+        Yields:
+            Individual phone number dictionaries
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.list_phone_numbers, page_size=page_size)
+            while future is not None:
+                response = future.result()
+                cursor = response.get("next_cursor")
+                future = (
+                    executor.submit(
+                        self.list_phone_numbers, cursor=cursor, page_size=page_size
+                    )
+                    if cursor else None
+                )
+                yield from response.get("phone_numbers", [])
+
     def update_phone_number(
         self,
         phone_number_id: str,
@@ -226,19 +256,17 @@ class PhoneNumberService(BaseClient):
         Returns:
             Updated phone number details
         """
-        with APICallLogger(self.logger, "Update Phone Number", phone_number_id=phone_number_id):
-            payload = {}
-            
-            if agent_id is not None:
-                payload["agent_id"] = agent_id
-            if label is not None:
-                payload["label"] = label
-            
-            payload.update(updates)
+        with self._apilog("Update Phone Number", phone_number_id=phone_number_id):
+            # One-shot construction; no post-hoc inserts or resizes
+            payload = {
+                **({"agent_id": agent_id} if agent_id is not None else {}),
+                **({"label": label} if label is not None else {}),
+                **updates
+            }
             
             response = self._make_request(
                 method="PATCH",
-                endpoint=f"{self.PHONE_NUMBERS_ENDPOINT}/{phone_number_id}",
+                endpoint=self._phone_base + phone_number_id,
                 data=payload
             )
             
@@ -257,10 +285,10 @@ class PhoneNumberService(BaseClient):
         Returns:
             Deletion confirmation
         """
-        with APICallLogger(self.logger, "Delete Phone Number", phone_number_id=phone_number_id):
+        with self._apilog("Delete Phone Number", phone_number_id=phone_number_id):
             response = self._make_request(
                 method="DELETE",
-                endpoint=f"{self.PHONE_NUMBERS_ENDPOINT}/{phone_number_id}"
+                endpoint=self._phone_base + phone_number_id
             )
             
             self.logger.info(f"Phone number deleted: {phone_number_id}")
@@ -312,19 +340,19 @@ class PhoneNumberService(BaseClient):
             >>> if call["success"]:
             ...     print(f"Call started: {call['conversation_id']}")
         """
-        with APICallLogger(self.logger, "Twilio Outbound Call",
-                          agent_id=agent_id, to_number=to_number):
+        with self._apilog("Twilio Outbound Call",
+                           agent_id=agent_id, to_number=to_number):
             payload = {
                 "agent_id": agent_id,
                 "agent_phone_number_id": agent_phone_number_id,
-                "to_number": to_number
+                "to_number": to_number,
+                **(
+                    {"conversation_initiation_client_data": conversation_initiation_client_data}
+                    if conversation_initiation_client_data is not None else {}
+                ),
+                **kwargs
             }
-            
-            if conversation_initiation_client_data is not None:
-                payload["conversation_initiation_client_data"] = conversation_initiation_client_data
-            
-            payload.update(kwargs)
-            
+
             response = self._make_request(
                 method="POST",
                 endpoint=self.TWILIO_OUTBOUND_CALL_ENDPOINT,
@@ -4,7 +4,9 @@ Run script for ElevenLabs Agent API.
 Starts the FastAPI server with configurable options.
 """
 
+import multiprocessing
 import os
+import shutil
 import sys
 from pathlib import Path
 
@@ -20,15 +22,25 @@ def main():
     
     # Load environment variables
     load_dotenv()
+
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        print("WARNING: orjson not installed; JSON responses will use the "
+              "slower stdlib encoder (pip install orjson)")
     
     # Server configuration from environment
     host = os.getenv("API_HOST", "0.0.0.0")
     port = int(os.getenv("API_PORT", "8000"))
     reload = os.getenv("API_RELOAD", "true").lower() == "true"
     log_level = os.getenv("API_LOG_LEVEL", "info").lower()
-    workers = int(os.getenv("API_WORKERS", "1"))
+    # Empirical sweet spot for gunicorn-managed workers
+    default_workers = 2 * multiprocessing.cpu_count() + 1
+    workers = int(os.getenv("API_WORKERS", str(default_workers)))
     
-    print(f"""
+    # Built once and emitted with a single write instead of print's
+    # line-buffered chunks
+    banner = f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║           ElevenLabs Agent API Server                        ║
 ╠══════════════════════════════════════════════════════════════╣
@@ -41,7 +53,8 @@ def main():
 ║  Documentation: http://{host}:{port}/docs{' ' * (38 - len(str(port)))}║
 ║  OpenAPI JSON:  http://{host}:{port}/openapi.json{' ' * (30 - len(str(port)))}║
 ╚══════════════════════════════════════════════════════════════╝
-    """)
+"""
+    sys.stdout.write(banner)
     
     # Run the server
     if reload:
@@ -51,10 +64,17 @@ def main():
             host=host,
             port=port,
             reload=reload,
-            log_level=log_level
+            log_level=log_level,
+            # C event loop and HTTP parser from uvicorn[standard];
+            # noticeably faster request dispatch than asyncio+h11
+            loop="uvloop",
+            http="httptools"
         )
-    else:
-        # Production mode with multiple workers
+    elif shutil.which("gunicorn") is None:
+        # Gunicorn missing from this install; uvicorn's own multi-worker
+        # mode still beats dying with FileNotFoundError
+        print("WARNING: gunicorn not installed; falling back to uvicorn "
+              "workers (pip install gunicorn)")
         uvicorn.run(
             "api.main:app",
             host=host,
@@ -62,6 +82,23 @@ def main():
             workers=workers,
             log_level=log_level
         )
+    else:
+        # Production mode: gunicorn supervises uvicorn worker processes,
+        # which behaves far better under sustained concurrent load than
+        # uvicorn's own multi-worker mode
+        os.execvp("gunicorn", [
+            "gunicorn",
+            "-k", "uvicorn.workers.UvicornWorker",
+            # Import the app once in the master; forked workers share the
+            # module pages copy-on-write and start instantly
+            "--preload",
+            "-w", str(workers),
+            "-b", f"{host}:{port}",
+            "--log-level", log_level,
+            "--worker-connections", "1000",
+            "--keep-alive", "5",
+            "api.main:app",
+        ])
 
 
 if __name__ == "__main__":
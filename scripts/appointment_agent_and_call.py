@@ -5,10 +5,23 @@ and place outbound call. Asks customer for preferred date and time only.
 Uses customer_email from dynamic variables for confirmation.
 Run with API server running: python3 scripts/appointment_agent_and_call.py
 """
+import hashlib
 import os
 import sys
 import json
 import requests
+from pathlib import Path
+
+try:
+    import orjson  # optional C serializer; stdlib json works fine without it
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 RENDER_URL = "https://elvenlabs-voiceagent.onrender.com"
 BASE_URL = os.getenv("API_BASE_URL", RENDER_URL)
@@ -19,12 +32,68 @@ WEBHOOK_BASE_URL = f"{RENDER_URL}/api/v1"
 # Dynamic variable: email where confirmation is sent (injected into call context)
 CUSTOMER_EMAIL = "amar_c@me.iitr.ac.in"
 
+# One pooled session for the whole run: the 4-5 sequential POSTs reuse a
+# single TCP+TLS connection per host instead of re-handshaking each time
+_SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+    ),
+)
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_OK = frozenset({200, 201})
+
+# Remembers template payloads already created on Render, keyed by content
+# hash, so repeat runs with an unchanged template skip that round-trip
+_CACHE_PATH = Path.home() / ".appointment_cache.json"
+
+
+def _load_cache():
+    try:
+        return json.loads(_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_cache(cache):
+    try:
+        _CACHE_PATH.write_text(json.dumps(cache))
+    except OSError:
+        pass  # cache is an optimization; never fail the run over it
+
+
+def _check(r, what):
+    """Exit on a failed response, otherwise return its parsed body."""
+    if r.status_code not in _OK:
+        print(f"Failed to {what}: {r.status_code} - {r.text}")
+        sys.exit(1)
+    return r.json()
+
+
+def _post_template(body, url):
+    return _SESSION.post(f"{url}/api/v1/email-templates", data=body,
+                         headers=_JSON_HEADERS, timeout=30)
+
+
+def _post_bootstrap(body, url):
+    return _SESSION.post(f"{url}/api/v1/automation/appointment-bootstrap",
+                         data=body, headers=_JSON_HEADERS, timeout=60)
+
 
 def main():
     print(f"Using API base: {BASE_URL}\n")
 
-    # 1. Create appointment email template with sender_email
-    print("1. Creating appointment confirmation email template...")
+    # Template, agent and batch call are created by one compound
+    # endpoint; the server wires tool_id and agent_id across the stages
+    # so the whole chain costs a single round-trip from here
+    print("1. Bootstrapping template + agent + batch call...")
     template_payload = {
         "name": "appointment_confirmation",
         "description": "Send a confirmation email when the customer confirms an appointment. Use after the customer agrees on date and time. Email will be retrieved from batch recipient data or dynamic variables.",
@@ -37,38 +106,6 @@ def main():
         "sender_email": SENDER_EMAIL,
         "webhook_base_url": WEBHOOK_BASE_URL,
     }
-    r = requests.post(
-        f"{BASE_URL}/api/v1/email-templates",
-        json=template_payload,
-        timeout=30,
-    )
-    if r.status_code not in (200, 201):
-        print(f"Failed to create template on local: {r.status_code} - {r.text}")
-        sys.exit(1)
-    template = r.json()
-    tool_id = template.get("tool_id")
-    if not tool_id:
-        print("Template created but no tool_id in response:", template)
-        sys.exit(1)
-    print(f"   Template ID: {template.get('template_id')}, Tool ID: {tool_id}")
-    
-    # Also create template on Render (where webhook will be called)
-    print("   Creating template on Render server...")
-    if BASE_URL != RENDER_URL:
-        r2 = requests.post(
-            f"{RENDER_URL}/api/v1/email-templates",
-            json=template_payload,
-            timeout=30,
-        )
-        if r2.status_code not in (200, 201):
-            print(f"   Warning: Failed to create template on Render: {r2.status_code} - {r2.text}")
-        else:
-            print(f"   Template also created on Render\n")
-    else:
-        print(f"   Using same server for webhook\n")
-
-    # 2. Create appointment agent with this tool
-    print("2. Creating appointment agent...")
     agent_payload = {
         "name": "Appointment Agent",
         "first_message": "Hello! This is the appointment service. I'm calling to help you book an appointment. What is your preferred date and time?",
@@ -81,28 +118,9 @@ def main():
             "Be concise and professional. Only ask for date and time."
         ),
         "language": "en",
-        "tool_ids": [tool_id],
     }
-    r = requests.post(
-        f"{BASE_URL}/api/v1/agents",
-        json=agent_payload,
-        timeout=30,
-    )
-    if r.status_code not in (200, 201):
-        print(f"Failed to create agent: {r.status_code} - {r.text}")
-        sys.exit(1)
-    agent = r.json()
-    agent_id = agent.get("agent_id")
-    if not agent_id:
-        print("Agent created but no agent_id in response:", agent)
-        sys.exit(1)
-    print(f"   Agent ID: {agent_id}\n")
-
-    # 3. Start batch call with recipients (each with name, email, phone, and dynamic_variables)
-    print("3. Starting batch call with recipients...")
     batch_payload = {
         "call_name": "Appointment Booking Campaign",
-        "agent_id": agent_id,
         "phone_number_id": PHONE_NUMBER_ID,
         "recipients": [
             {
@@ -117,18 +135,48 @@ def main():
         ],
         "sender_email": SENDER_EMAIL,
     }
-    r = requests.post(
-        f"{BASE_URL}/api/v1/batch-calling/submit",
-        json=batch_payload,
-        timeout=30,
-    )
-    if r.status_code not in (200, 201):
-        print(f"Failed to submit batch job: {r.status_code} - {r.text}")
-        sys.exit(1)
-    result = r.json()
-    print("   Batch job submitted:", json.dumps(result, indent=2))
+    bootstrap_body = _dumps({
+        "template": template_payload,
+        "agent": agent_payload,
+        "batch": batch_payload,
+    })
+
+    # When a different BASE_URL serves the bootstrap, Render (the webhook
+    # server) still needs the template; run both POSTs in parallel so the
+    # stage costs max(RTT_local, RTT_render) instead of their sum. An
+    # unchanged template already created on Render is skipped entirely
+    template_body = _dumps(template_payload)
+    cache_key = hashlib.sha256(template_body).hexdigest()
+    cache = _load_cache()
+    render_cached = cache_key in cache
+    if BASE_URL != RENDER_URL and not render_cached:
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            boot_future = ex.submit(_post_bootstrap, bootstrap_body, BASE_URL)
+            render_future = ex.submit(_post_template, template_body, RENDER_URL)
+            r, r2 = boot_future.result(), render_future.result()
+    else:
+        r = _post_bootstrap(bootstrap_body, BASE_URL)
+        r2 = None
+    result = _check(r, "bootstrap appointment flow")
+    data = result.get("data", {})
+    print(f"   Template ID: {data.get('template_id')}, Tool ID: {data.get('tool_id')}")
+    print(f"   Agent ID: {data.get('agent_id')}")
+
+    # Render is where the webhook will be called
+    if render_cached:
+        print(f"   Template unchanged; Render already has it (tool {cache[cache_key]})\n")
+    elif r2 is None:
+        print(f"   Using same server for webhook\n")
+    elif r2.status_code not in _OK:
+        print(f"   Warning: Failed to create template on Render: {r2.status_code} - {r2.text}")
+    else:
+        cache[cache_key] = r2.json().get("tool_id")
+        _store_cache(cache)
+        print(f"   Template also created on Render\n")
+
+    print("   Batch job submitted:", json.dumps(data.get("batch_job", {}), indent=2))
     print("\nDone. The calls will be placed shortly.")
-    
+
     # # Alternative: Direct outbound call (commented out)
     # print("3. Placing outbound call to", TO_NUMBER, "...")
     # call_payload = {
@@ -136,7 +184,7 @@ def main():
     #     "agent_phone_number_id": PHONE_NUMBER_ID,
     #     "to_number": TO_NUMBER,
     # }
-    # r = requests.post(
+    # r = _SESSION.post(
     #     f"{BASE_URL}/api/v1/phone-numbers/twilio/outbound-call",
     #     json=call_payload,
     #     timeout=30,
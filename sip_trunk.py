@@ -7,7 +7,6 @@ from typing import Optional, Dict, Any
 
 from base import BaseClient
 from config import ElevenLabsConfig
-from logger import APICallLogger
 
 
 class SIPTrunkService(BaseClient):
@@ -41,6 +40,9 @@ class SIPTrunkService(BaseClient):
             config: ElevenLabsConfig instance
         """
         super().__init__(config, logger_name="elevenlabs.sip_trunk")
+        # Fixed prefix for per-trunk endpoints; per-call paths become a
+        # single concatenation instead of an f-string build
+        self._trunk_base = self.SIP_TRUNK_ENDPOINT + "/"
         self.logger.info("SIPTrunkService initialized")
     
     def outbound_call(
@@ -87,41 +89,87 @@ class SIPTrunkService(BaseClient):
             >>> if call["success"]:
             ...     print(f"Call started: {call['conversation_id']}")
         """
-        with APICallLogger(self.logger, "Outbound Call via SIP",
-                          agent_id=agent_id, to_number=to_number):
+        with self._apilog("Outbound Call via SIP",
+                           agent_id=agent_id, to_number=to_number):
+            # One-shot construction; no post-hoc inserts or resizes on
+            # the per-recipient hot path
             payload = {
                 "agent_id": agent_id,
                 "agent_phone_number_id": agent_phone_number_id,
-                "to_number": to_number
+                "to_number": to_number,
+                **({"custom_llm_extra_body": custom_llm_extra_body}
+                   if custom_llm_extra_body is not None else {}),
+                **({"dynamic_variables": dynamic_variables}
+                   if dynamic_variables is not None else {}),
+                **({"first_message": first_message}
+                   if first_message is not None else {}),
+                **kwargs
             }
             
-            if custom_llm_extra_body is not None:
-                payload["custom_llm_extra_body"] = custom_llm_extra_body
-            
-            if dynamic_variables is not None:
-                payload["dynamic_variables"] = dynamic_variables
-            
-            if first_message is not None:
-                payload["first_message"] = first_message
-            
-            payload.update(kwargs)
-            
-            response = self._make_request(
-                method="POST",
-                endpoint=self.OUTBOUND_CALL_ENDPOINT,
-                data=payload
-            )
-            
+            # Hottest path in batch dial-out; take the low-overhead pool
+            response = self._fast_post(self.OUTBOUND_CALL_ENDPOINT, payload)
+
             success = response.get("success", False)
             conv_id = response.get("conversation_id", "unknown")
             
             if success:
-                self.logger.info(f"Outbound call initiated: {conv_id}")
+                self.logger.info("Outbound call initiated: %s", conv_id)
             else:
-                self.logger.warning(f"Outbound call failed: {response.get('message', 'Unknown error')}")
+                self.logger.warning("Outbound call failed: %s", response.get("message", "Unknown error"))
             
             return response
     
+    async def outbound_call_async(
+        self,
+        agent_id: str,
+        agent_phone_number_id: str,
+        to_number: str,
+        custom_llm_extra_body: Optional[Dict[str, Any]] = None,
+        dynamic_variables: Optional[Dict[str, str]] = None,
+        first_message: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async variant of outbound_call for concurrent batch dial-out.
+
+        A script placing N calls can gather them so wallclock approaches
+        a single round-trip instead of N sequential ones:
+
+            await asyncio.gather(
+                *(service.outbound_call_async(**r) for r in recipients)
+            )
+
+        Args and response are identical to outbound_call.
+        """
+        payload = {
+            "agent_id": agent_id,
+            "agent_phone_number_id": agent_phone_number_id,
+            "to_number": to_number,
+            **({"custom_llm_extra_body": custom_llm_extra_body}
+               if custom_llm_extra_body is not None else {}),
+            **({"dynamic_variables": dynamic_variables}
+               if dynamic_variables is not None else {}),
+            **({"first_message": first_message}
+               if first_message is not None else {}),
+            **kwargs
+        }
+
+        response = await self._make_request_async(
+            method="POST",
+            endpoint=self.OUTBOUND_CALL_ENDPOINT,
+            data=payload
+        )
+
+        success = response.get("success", False)
+        conv_id = response.get("conversation_id", "unknown")
+
+        if success:
+            self.logger.info("Outbound call initiated: %s", conv_id)
+        else:
+            self.logger.warning("Outbound call failed: %s", response.get("message", "Unknown error"))
+
+        return response
+
     def get_sip_trunk(self, sip_trunk_id: str) -> Dict[str, Any]:
         """
         Get details of a SIP trunk configuration.
@@ -132,13 +180,13 @@ class SIPTrunkService(BaseClient):
         Returns:
             SIP trunk configuration details
         """
-        with APICallLogger(self.logger, "Get SIP Trunk", sip_trunk_id=sip_trunk_id):
+        with self._apilog("Get SIP Trunk", sip_trunk_id=sip_trunk_id):
             response = self._make_request(
                 method="GET",
-                endpoint=f"{self.SIP_TRUNK_ENDPOINT}/{sip_trunk_id}"
+                endpoint=self._trunk_base + sip_trunk_id
             )
             
-            self.logger.info(f"Retrieved SIP trunk: {sip_trunk_id}")
+            self.logger.info("Retrieved SIP trunk: %s", sip_trunk_id)
             return response
     
     def list_sip_trunks(self) -> Dict[str, Any]:
@@ -148,14 +196,14 @@ class SIPTrunkService(BaseClient):
         Returns:
             List of SIP trunk configurations
         """
-        with APICallLogger(self.logger, "List SIP Trunks"):
+        with self._apilog("List SIP Trunks"):
             response = self._make_request(
                 method="GET",
                 endpoint=self.SIP_TRUNK_ENDPOINT
             )
             
             count = len(response.get("sip_trunks", []))
-            self.logger.info(f"Retrieved {count} SIP trunks")
+            self.logger.info("Retrieved %d SIP trunks", count)
             return response
     
     def create_sip_trunk(
@@ -177,17 +225,14 @@ class SIPTrunkService(BaseClient):
         Returns:
             Created SIP trunk details
         """
-        with APICallLogger(self.logger, "Create SIP Trunk", name=name):
+        with self._apilog("Create SIP Trunk", name=name):
             payload = {
                 "name": name,
-                "sip_uri": sip_uri
+                "sip_uri": sip_uri,
+                **({"authentication": authentication} if authentication else {}),
+                **kwargs
             }
             
-            if authentication:
-                payload["authentication"] = authentication
-            
-            payload.update(kwargs)
-            
             response = self._make_request(
                 method="POST",
                 endpoint=self.SIP_TRUNK_ENDPOINT,
@@ -195,7 +240,7 @@ class SIPTrunkService(BaseClient):
             )
             
             trunk_id = response.get("sip_trunk_id", "unknown")
-            self.logger.info(f"SIP trunk created: {trunk_id}")
+            self.logger.info("SIP trunk created: %s", trunk_id)
             return response
     
     def delete_sip_trunk(self, sip_trunk_id: str) -> Dict[str, Any]:
@@ -208,11 +253,11 @@ class SIPTrunkService(BaseClient):
         Returns:
             Deletion confirmation
         """
-        with APICallLogger(self.logger, "Delete SIP Trunk", sip_trunk_id=sip_trunk_id):
+        with self._apilog("Delete SIP Trunk", sip_trunk_id=sip_trunk_id):
             response = self._make_request(
                 method="DELETE",
-                endpoint=f"{self.SIP_TRUNK_ENDPOINT}/{sip_trunk_id}"
+                endpoint=self._trunk_base + sip_trunk_id
             )
             
-            self.logger.info(f"SIP trunk deleted: {sip_trunk_id}")
+            self.logger.info("SIP trunk deleted: %s", sip_trunk_id)
             return response
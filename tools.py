@@ -3,11 +3,99 @@ Tools Service for ElevenLabs API.
 Manages custom tools that agents can use during conversations.
 """
 
-from typing import Optional, Dict, Any, List
+import asyncio
+import copy
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 
 from base import BaseClient
 from config import ElevenLabsConfig
-from logger import APICallLogger
+from exceptions import ValidationError
+
+# ElevenLabs allows only ONE of description, dynamic_variable,
+# constant_value or is_system_provided per property; precedence order
+_EXCLUSIVE_FIELDS = ("dynamic_variable", "constant_value", "is_system_provided")
+
+# Shared parameter definitions for the ecommerce tools; one frozen
+# module-level object so both creates in create_ecommerce_tools pass the
+# identical structure and the second schema build is a pure cache hit
+_COMMON_ECOMMERCE_PARAMS = (
+    {
+        "name": "conversation_id",
+        "type": "string",
+        "description": "Conversation identifier for credential lookup",
+        "required": True,
+        "dynamic_variable": "system__conversation_id"  # Auto-filled by ElevenLabs
+    },
+    {
+        "name": "limit",
+        "type": "integer",
+        "description": "Number of items to fetch (1-20)",
+        "required": False
+    },
+)
+
+
+def _schema_from(parameters) -> Dict[str, Any]:
+    """
+    Build a request_body_schema from parameter definitions.
+
+    Validates each definition in the same pass that projects it, so a
+    malformed parameter fails here with a clear message instead of as a
+    4xx from the server one round-trip later.
+    """
+    properties = {}
+    required = []
+    for param in parameters:
+        get = param.get
+        name = get("name")
+        if not isinstance(name, str) or not name:
+            raise ValidationError(
+                f"Tool parameter definition needs a non-empty 'name': {param!r}"
+            )
+        prop = {"type": get("type", "string")}
+        for field in _EXCLUSIVE_FIELDS:
+            value = get(field)
+            if value:
+                prop[field] = value
+                break
+        else:
+            prop["description"] = get("description", "")
+        properties[name] = prop
+        if get("required", False):
+            required.append(name)
+    return {"type": "object", "properties": properties, "required": required}
+
+
+@lru_cache(maxsize=64)
+def _cached_schema(frozen) -> Dict[str, Any]:
+    """Schema for a frozen (hashable) parameter list."""
+    return _schema_from(dict(items) for items in frozen)
+
+
+def _build_request_body_schema(
+    parameters: Optional[List[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """
+    Schema for a parameter list, memoized on its content.
+
+    Repeated creations with the same parameters (create_ecommerce_tools
+    builds two tools from one common_params list) hit the cache instead
+    of re-walking the definitions. Returns a deep copy so callers can't
+    mutate the cached value.
+    """
+    if not parameters:
+        return {"type": "object", "properties": {}, "required": []}
+    try:
+        frozen = tuple(tuple(sorted(p.items())) for p in parameters)
+        return copy.deepcopy(_cached_schema(frozen))
+    except TypeError:
+        # Unhashable values in a definition (dict- or list-valued
+        # fields); build directly, uncached
+        return _schema_from(parameters)
 
 
 class ToolsService(BaseClient):
@@ -30,15 +118,23 @@ class ToolsService(BaseClient):
     
     # API Endpoints
     TOOLS_ENDPOINT = "/v1/convai/tools"
-    
+
+    # Tool definitions rarely change; get_tool answers from a short-lived
+    # cache so repeated lookups inside one workflow skip the round-trip
+    _TOOL_CACHE_TTL = 5.0
+
     def __init__(self, config: ElevenLabsConfig):
         """
         Initialize Tools Service.
-        
+
         Args:
             config: ElevenLabsConfig instance
         """
         super().__init__(config, logger_name="elevenlabs.tools")
+        # Fixed prefix for per-tool endpoints; per-call paths become a
+        # single concatenation instead of an f-string build
+        self._tool_base = self.TOOLS_ENDPOINT + "/"
+        self._tool_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         self.logger.info("ToolsService initialized")
     
     def create_webhook_tool(
@@ -78,61 +174,26 @@ class ToolsService(BaseClient):
             ...     ]
             ... )
         """
-        with APICallLogger(self.logger, "Create Webhook Tool", name=name):
-            # Build request body schema for parameters
-            request_body_schema = {
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-            
-            if parameters:
-                for param in parameters:
-                    param_name = param["name"]
-                    prop = {
-                        "type": param.get("type", "string")
+        with self._apilog("Create Webhook Tool", name=name):
+            # ElevenLabs webhook api_schema format: api_schema goes
+            # directly under tool_config (not nested in webhook) and POST
+            # requires request_body_schema. Built in one shot; no
+            # post-hoc inserts or resizes
+            payload = {
+                "tool_config": {
+                    "type": "webhook",
+                    "name": name,
+                    "description": description,
+                    "api_schema": {
+                        "url": webhook_url,
+                        "method": http_method,
+                        "request_body_schema": _build_request_body_schema(parameters),
+                        **({"request_headers": headers} if headers else {})
                     }
-                    
-                    # ElevenLabs API: Can only set ONE of: description, dynamic_variable, 
-                    # is_system_provided, or constant_value
-                    if param.get("dynamic_variable"):
-                        prop["dynamic_variable"] = param["dynamic_variable"]
-                    elif param.get("constant_value"):
-                        prop["constant_value"] = param["constant_value"]
-                    elif param.get("is_system_provided"):
-                        prop["is_system_provided"] = param["is_system_provided"]
-                    else:
-                        # Only add description if no other special field is set
-                        prop["description"] = param.get("description", "")
-                    
-                    request_body_schema["properties"][param_name] = prop
-                    
-                    if param.get("required", False):
-                        request_body_schema["required"].append(param_name)
-            
-            # ElevenLabs webhook api_schema format
-            # api_schema goes directly under tool_config (not nested in webhook)
-            # POST method requires request_body_schema
-            api_schema = {
-                "url": webhook_url,
-                "method": http_method,
-                "request_body_schema": request_body_schema  # Required for POST
-            }
-            
-            # Only add headers if provided
-            if headers:
-                api_schema["request_headers"] = headers
-            
-            tool_config = {
-                "type": "webhook",
-                "name": name,
-                "description": description,
-                "api_schema": api_schema  # api_schema is at tool_config level
+                },
+                **kwargs
             }
-            
-            payload = {"tool_config": tool_config}
-            payload.update(kwargs)
-            
+
             response = self._make_request(
                 method="POST",
                 endpoint=self.TOOLS_ENDPOINT,
@@ -142,9 +203,83 @@ class ToolsService(BaseClient):
             # API returns 'id', normalize to 'tool_id' for consistency
             tool_id = response.get("id") or response.get("tool_id", "unknown")
             response["tool_id"] = tool_id
-            self.logger.info(f"Webhook tool created: {tool_id}")
+            self._tool_cache.clear()
+            self.logger.info("Webhook tool created: %s", tool_id)
             return response
     
+    async def create_webhook_tool_async(
+        self,
+        name: str,
+        description: str,
+        webhook_url: str,
+        parameters: Optional[List[Dict[str, Any]]] = None,
+        http_method: str = "POST",
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Async variant of create_webhook_tool for concurrent bulk bring-up.
+
+        Goes through the shared httpx client, so many creates multiplex
+        over pooled connections instead of paying one round-trip each.
+        Args and response are identical to create_webhook_tool.
+        """
+        payload = {
+            "tool_config": {
+                "type": "webhook",
+                "name": name,
+                "description": description,
+                "api_schema": {
+                    "url": webhook_url,
+                    "method": http_method,
+                    "request_body_schema": _build_request_body_schema(parameters),
+                    **({"request_headers": headers} if headers else {})
+                }
+            },
+            **kwargs
+        }
+
+        response = await self._make_request_async(
+            method="POST",
+            endpoint=self.TOOLS_ENDPOINT,
+            data=payload
+        )
+
+        tool_id = response.get("id") or response.get("tool_id", "unknown")
+        response["tool_id"] = tool_id
+        self._tool_cache.clear()
+        self.logger.info("Webhook tool created: %s", tool_id)
+        return response
+
+    async def create_webhook_tools_bulk_async(
+        self,
+        specs: List[Dict[str, Any]],
+        max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several webhook tools concurrently under asyncio.
+
+        Semaphore-gated gather: at most max_concurrency creates are in
+        flight at once, so N tools cost roughly ceil(N / max_concurrency)
+        round-trips while the API quota stays respected.
+
+        Args:
+            specs: List of create_webhook_tool_async keyword-argument dicts
+            max_concurrency: Upper bound on in-flight creates
+
+        Returns:
+            Created tool details, in the same order as specs
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded_create(spec):
+            async with semaphore:
+                return await self.create_webhook_tool_async(**spec)
+
+        return list(await asyncio.gather(
+            *(bounded_create(spec) for spec in specs)
+        ))
+
     def create_client_tool(
         self,
         name: str,
@@ -164,31 +299,31 @@ class ToolsService(BaseClient):
         Returns:
             Created tool details
         """
-        with APICallLogger(self.logger, "Create Client Tool", name=name):
-            tool_config = {
-                "type": "client",
-                "name": name,
-                "description": description
+        with self._apilog("Create Client Tool", name=name):
+            # One-shot construction; no post-hoc inserts or resizes
+            payload = {
+                "tool_config": {
+                    "type": "client",
+                    "name": name,
+                    "description": description,
+                    **({"parameters": {
+                        "type": "object",
+                        "properties": {
+                            p["name"]: {
+                                "type": p.get("type", "string"),
+                                "description": p.get("description", "")
+                            }
+                            for p in parameters
+                        },
+                        "required": [
+                            p["name"] for p in parameters
+                            if p.get("required", False)
+                        ]
+                    }} if parameters else {})
+                },
+                **kwargs
             }
-            
-            if parameters:
-                tool_config["parameters"] = {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-                for param in parameters:
-                    param_name = param["name"]
-                    tool_config["parameters"]["properties"][param_name] = {
-                        "type": param.get("type", "string"),
-                        "description": param.get("description", "")
-                    }
-                    if param.get("required", False):
-                        tool_config["parameters"]["required"].append(param_name)
-            
-            payload = {"tool_config": tool_config}
-            payload.update(kwargs)
-            
+
             response = self._make_request(
                 method="POST",
                 endpoint=self.TOOLS_ENDPOINT,
@@ -198,9 +333,38 @@ class ToolsService(BaseClient):
             # API returns 'id', normalize to 'tool_id' for consistency
             tool_id = response.get("id") or response.get("tool_id", "unknown")
             response["tool_id"] = tool_id
-            self.logger.info(f"Client tool created: {tool_id}")
+            self._tool_cache.clear()
+            self.logger.info("Client tool created: %s", tool_id)
             return response
     
+    def create_webhook_tools_bulk(
+        self,
+        specs: List[Dict[str, Any]],
+        max_concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several webhook tools concurrently.
+
+        Each spec is a kwargs dict for create_webhook_tool. The creates
+        are independent POSTs to the same host, so firing them through a
+        bounded pool collapses N sequential round-trips to roughly
+        ceil(N / max_concurrency); the shared rate limiter still paces
+        each request against the API quota.
+
+        Args:
+            specs: List of create_webhook_tool keyword-argument dicts
+            max_concurrency: Upper bound on in-flight creates
+
+        Returns:
+            Created tool details, in the same order as specs
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = [
+                executor.submit(self.create_webhook_tool, **spec)
+                for spec in specs
+            ]
+            return [future.result() for future in futures]
+
     def get_tool(self, tool_id: str) -> Dict[str, Any]:
         """
         Get details of a specific tool.
@@ -211,19 +375,24 @@ class ToolsService(BaseClient):
         Returns:
             Tool details
         """
-        with APICallLogger(self.logger, "Get Tool", tool_id=tool_id):
+        cached = self._tool_cache.get(tool_id)
+        if cached is not None and time.monotonic() - cached[0] < self._TOOL_CACHE_TTL:
+            return cached[1]
+
+        with self._apilog("Get Tool", tool_id=tool_id):
             response = self._make_request(
                 method="GET",
-                endpoint=f"{self.TOOLS_ENDPOINT}/{tool_id}"
+                endpoint=self._tool_base + tool_id
             )
-            
-            self.logger.info(f"Retrieved tool: {tool_id}")
+
+            self._tool_cache[tool_id] = (time.monotonic(), response)
+            self.logger.info("Retrieved tool: %s", tool_id)
             return response
     
     def list_tools(
         self,
         cursor: Optional[str] = None,
-        page_size: int = 30
+        page_size: int = 100
     ) -> Dict[str, Any]:
         """
         List all tools.
@@ -235,7 +404,7 @@ class ToolsService(BaseClient):
         Returns:
             List of tools
         """
-        with APICallLogger(self.logger, "List Tools"):
+        with self._apilog("List Tools"):
             params = {"page_size": page_size}
             if cursor:
                 params["cursor"] = cursor
@@ -246,10 +415,41 @@ class ToolsService(BaseClient):
                 params=params
             )
             
-            count = len(response.get("tools", []))
-            self.logger.info(f"Retrieved {count} tools")
+            # Tuple sentinel: no throwaway list when the page has none,
+            # and the whole count is skipped when INFO is filtered out
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "Retrieved %d tools", len(response.get("tools", ()))
+                )
             return response
     
+    def iter_tools(self, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every tool across all pages.
+
+        Prefetches the next page on a background thread while the caller
+        consumes the current one, overlapping the network round-trip
+        with per-tool processing.
+
+        Args:
+            page_size: Results requested per page
+
+        Yields:
+            Individual tool dictionaries
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.list_tools, page_size=page_size)
+            while future is not None:
+                response = future.result()
+                cursor = response.get("next_cursor")
+                future = (
+                    executor.submit(
+                        self.list_tools, cursor=cursor, page_size=page_size
+                    )
+                    if cursor else None
+                )
+                yield from response.get("tools", [])
+
     def delete_tool(self, tool_id: str) -> Dict[str, Any]:
         """
         Delete a tool.
@@ -260,13 +460,14 @@ class ToolsService(BaseClient):
         Returns:
             Deletion confirmation
         """
-        with APICallLogger(self.logger, "Delete Tool", tool_id=tool_id):
+        with self._apilog("Delete Tool", tool_id=tool_id):
             response = self._make_request(
                 method="DELETE",
-                endpoint=f"{self.TOOLS_ENDPOINT}/{tool_id}"
+                endpoint=self._tool_base + tool_id
             )
-            
-            self.logger.info(f"Deleted tool: {tool_id}")
+
+            self._tool_cache.pop(tool_id, None)
+            self.logger.info("Deleted tool: %s", tool_id)
             return response
     
     def create_ecommerce_tools(
@@ -288,38 +489,28 @@ class ToolsService(BaseClient):
         """
         # Remove trailing slash to avoid double slashes
         base_url = webhook_base_url.rstrip('/')
-        
-        # Common parameters for ecommerce tools - include conversation_id for credential lookup
-        common_params = [
-            {
-                "name": "conversation_id",
-                "type": "string",
-                "description": "Conversation identifier for credential lookup",
-                "required": True,
-                "dynamic_variable": "system__conversation_id"  # Auto-filled by ElevenLabs
-            },
-            {
-                "name": "limit",
-                "type": "integer",
-                "description": "Number of items to fetch (1-20)",
-                "required": False
-            }
-        ]
-        
-        products_tool = self.create_webhook_tool(
-            name="get_products",
-            description="Fetch products from the ecommerce store. Use this when the user asks about products, inventory, catalog, what items are available, or pricing information.",
-            webhook_url=f"{base_url}/webhooks/ecommerce/products",
-            parameters=common_params
-        )
-        
-        orders_tool = self.create_webhook_tool(
-            name="get_orders",
-            description="Fetch recent orders from the ecommerce store. Use this when the user asks about their orders, order status, order history, or shipment tracking.",
-            webhook_url=f"{base_url}/webhooks/ecommerce/orders",
-            parameters=common_params
-        )
-        
+
+        # Common parameters (conversation_id for credential lookup) live
+        # at module scope; see _COMMON_ECOMMERCE_PARAMS
+
+        # The two creations are independent POSTs to the same host;
+        # the bulk helper issues them concurrently for one round-trip
+        # instead of two
+        products_tool, orders_tool = self.create_webhook_tools_bulk([
+            dict(
+                name="get_products",
+                description="Fetch products from the ecommerce store. Use this when the user asks about products, inventory, catalog, what items are available, or pricing information.",
+                webhook_url=f"{base_url}/webhooks/ecommerce/products",
+                parameters=_COMMON_ECOMMERCE_PARAMS
+            ),
+            dict(
+                name="get_orders",
+                description="Fetch recent orders from the ecommerce store. Use this when the user asks about their orders, order status, order history, or shipment tracking.",
+                webhook_url=f"{base_url}/webhooks/ecommerce/orders",
+                parameters=_COMMON_ECOMMERCE_PARAMS
+            ),
+        ])
+
         return {
             "products_tool_id": products_tool.get("tool_id"),
             "orders_tool_id": orders_tool.get("tool_id")
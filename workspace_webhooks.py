@@ -7,7 +7,6 @@ from typing import Any, Dict, Optional
 
 from base import BaseClient
 from config import ElevenLabsConfig
-from logger import APICallLogger
 
 
 class WorkspaceWebhookService(BaseClient):
@@ -20,7 +19,7 @@ class WorkspaceWebhookService(BaseClient):
 
     def list_webhooks(self, include_usages: bool = False) -> Dict[str, Any]:
         """List all workspace webhooks."""
-        with APICallLogger(self.logger, "List workspace webhooks"):
+        with self._apilog("List workspace webhooks"):
             params = {"include_usages": "true"} if include_usages else None
             return self._make_request("GET", self.ENDPOINT, params=params)
 
@@ -30,7 +29,7 @@ class WorkspaceWebhookService(BaseClient):
 
         Returns webhook_id and webhook_secret (store secret for verifying signatures).
         """
-        with APICallLogger(self.logger, "Create workspace webhook", name=name):
+        with self._apilog("Create workspace webhook", name=name):
             payload = {
                 "settings": {
                     "auth_type": "hmac",